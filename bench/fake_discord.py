@@ -0,0 +1,42 @@
+import asyncio
+from typing import Dict
+
+class FakeChannel:
+    """
+    Records what would have been sent, optionally after a simulated API round trip.
+    """
+    __slots__ = ('id', 'transport')
+
+    def __init__(self, channel_id: int, transport: 'FakeTransport'):
+        self.id = channel_id
+        self.transport = transport
+
+    async def send(self, content=None, **kwargs):
+        if self.transport.latency:
+            await asyncio.sleep(self.transport.latency)
+        self.transport.sent += 1
+        self.transport.embeds += len(kwargs.get('embeds') or ()) + (1 if kwargs.get('embed') else 0)
+
+class FakeTransport:
+    """
+    Replaces the bot's channel lookup so sends never leave the process.
+    """
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.sent = 0
+        self.embeds = 0
+        self._channels: Dict[int, FakeChannel] = {}
+
+    def get_channel(self, channel_id: int) -> FakeChannel:
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = FakeChannel(channel_id, self)
+        return channel
+
+    def attach(self, bot):
+        bot.get_channel = self.get_channel
+        bot.is_ready = lambda: True
+
+    def reset(self):
+        self.sent = 0
+        self.embeds = 0
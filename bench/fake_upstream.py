@@ -0,0 +1,68 @@
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Dict, List
+from aiohttp import web
+
+class FakeUpstream:
+    """
+    Local stand-in for the CTFtime, Unstop and Devpost endpoints, serving fixture data
+    with the same paging parameters and ETag handling as the real APIs.
+    """
+    def __init__(self, ctftime: List[Dict], unstop: List[Dict], devpost: List[Dict] = (), latency: float = 0.0):
+        self.ctftime = sorted(ctftime, key=lambda r: r['start'])
+        self.unstop = unstop
+        self.devpost = list(devpost)
+        self.latency = latency
+        self.requests = 0
+        self._runner = None
+        self.base_url = None
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get('/api/v1/events/', self._ctftime)
+        app.router.add_get('/api/public/opportunity/search-result', self._unstop)
+        app.router.add_get('/api/hackathons', self._devpost)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _respond(self, request: web.Request, body: bytes, content_type: str) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        return web.Response(body=body, content_type=content_type, headers={'ETag': etag})
+
+    async def _ctftime(self, request: web.Request) -> web.Response:
+        limit = int(request.query.get('limit', 100))
+        start = datetime.fromtimestamp(int(request.query.get('start', 0)), timezone.utc).isoformat()
+        finish = datetime.fromtimestamp(int(request.query.get('finish', 2 ** 31)), timezone.utc).isoformat()
+        page = [r for r in self.ctftime if start <= r['start'] < finish][:limit]
+        return await self._respond(request, json.dumps(page).encode(), 'application/json')
+
+    async def _unstop(self, request: web.Request) -> web.Response:
+        per_page = int(request.query.get('per_page', 20))
+        page = int(request.query.get('page', 1))
+        last_page = max(1, -(-len(self.unstop) // per_page))
+        data = self.unstop[(page - 1) * per_page:page * per_page]
+        body = json.dumps({'data': {'data': data, 'last_page': last_page}}).encode()
+        return await self._respond(request, body, 'application/json')
+
+    async def _devpost(self, request: web.Request) -> web.Response:
+        per_page = 9
+        page = int(request.query.get('page', 1))
+        data = self.devpost[(page - 1) * per_page:page * per_page]
+        body = json.dumps({'hackathons': data, 'meta': {'total_count': len(self.devpost), 'per_page': per_page}}).encode()
+        return await self._respond(request, body, 'application/json')
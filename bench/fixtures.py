@@ -0,0 +1,89 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EVENTS_FIXTURE = os.path.join(ROOT, 'debug_events.json')
+
+def load_recorded_events() -> List[Dict]:
+    """
+    Normalized events recorded by test_scrapers.py.
+    """
+    with open(EVENTS_FIXTURE, 'r') as f:
+        return json.load(f)
+
+def _spread(count: int, days: int = 80) -> List[datetime]:
+    # Distinct, increasing start times inside the scrapers' query window
+    base = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    step = timedelta(days=days) / max(count, 1)
+    return [base + step * i for i in range(count)]
+
+def ctftime_records(count: int) -> List[Dict]:
+    """
+    CTFtime API records built from the recorded events, repeated up to count.
+    """
+    recorded = load_recorded_events()
+    records = []
+    for i, start in enumerate(_spread(count)):
+        event = recorded[i % len(recorded)]
+        records.append({
+            'id': i,
+            'title': f"{event['title']} #{i}",
+            'description': event.get('description'),
+            'start': start.isoformat(),
+            'finish': (start + timedelta(days=2)).isoformat(),
+            'url': f"{event.get('url') or 'https://example.org/'}?bench={i}",
+            'ctftime_url': f"https://ctftime.org/event/{100000 + i}/",
+            'format': event.get('type') or 'Jeopardy',
+            'logo': event.get('logo_url'),
+            'organizers': [{'name': name} for name in event.get('organizers') or []],
+            'weight': event.get('weight') or 0.0,
+            'onsite': False,
+        })
+    return records
+
+def unstop_records(count: int) -> List[Dict]:
+    """
+    Unstop search-result records built from the recorded events, newest first like the real listing.
+    """
+    recorded = load_recorded_events()
+    records = []
+    for i, start in enumerate(_spread(count)):
+        event = recorded[i % len(recorded)]
+        records.append({
+            'id': i,
+            'title': f"{event['title']} Hack #{i}",
+            'start_date': start.isoformat(),
+            'end_date': (start + timedelta(days=1)).isoformat(),
+            'seo_url': f"hackathons/bench-{i}",
+            'logo_url': event.get('logo_url'),
+            'organisation': {'name': (event.get('organizers') or ['Unknown'])[0]},
+            'region': 'Online',
+            'filters': {'about': event.get('description')},
+        })
+    records.reverse()
+    return records
+
+def devpost_records(count: int) -> List[Dict]:
+    """
+    Devpost listing API records built from the recorded events.
+    """
+    recorded = load_recorded_events()
+    records = []
+    for i, start in enumerate(_spread(count)):
+        event = recorded[i % len(recorded)]
+        end = start + timedelta(days=30)
+        records.append({
+            'id': i,
+            'title': f"{event['title']} Devpost #{i}",
+            'url': f"https://bench-{i}.devpost.com/",
+            'thumbnail_url': f"//d112y698adiu2z.cloudfront.net/photos/bench-{i}.png",
+            'submission_period_dates': f"{start:%b %d} - {end:%b %d, %Y}",
+            'displayed_location': {'icon': 'globe', 'location': 'Online'},
+            'themes': [{'id': 1, 'name': 'Machine Learning/AI'}, {'id': 2, 'name': 'Web'}],
+            'prize_amount': '$<span data-currency-value>10,000</span>',
+            'organization_name': (event.get('organizers') or ['Unknown'])[0],
+            'open_state': 'open',
+        })
+    return records
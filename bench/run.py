@@ -0,0 +1,211 @@
+"""
+Offline benchmarks for the scraper and notification hot paths.
+
+    python -m bench.run                          # print results
+    python -m bench.run --save bench.json        # keep them as a baseline
+    python -m bench.run --compare bench.json     # exit 1 on a regression
+
+Upstreams are served from fixtures by a local server and Discord sends go to a fake
+transport, so no network access or token is needed.
+"""
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The cogs open config.STATE_DB_FILE, keep benchmark state out of the real database
+_bench_dir = tempfile.mkdtemp(prefix='eventbot-bench-')
+os.environ['STATE_DB_FILE'] = os.path.join(_bench_dir, 'bench.db')
+atexit.register(shutil.rmtree, _bench_dir, ignore_errors=True)
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict
+import discord
+from discord.ext import commands
+from bench.fake_discord import FakeTransport
+from bench.fake_upstream import FakeUpstream
+from bench import fixtures
+from bot.delivery import TokenBucket
+from scrapers.ctftime import CTFTimeScraper
+from scrapers.dedup import merge_events
+from scrapers.devpost import DevpostScraper
+from scrapers.http_client import HttpClient
+from scrapers.manager import ScraperManager
+from scrapers.unstop import UnstopScraper
+
+def timed(fn, *args, repeat: int = 5):
+    # Best of several runs, the least noisy estimate of the code's own cost
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+def point_at(manager: ScraperManager, base_url: str):
+    for scraper in manager.scrapers:
+        if isinstance(scraper, CTFTimeScraper):
+            scraper.api_url = f"{base_url}/api/v1/events/"
+        elif isinstance(scraper, UnstopScraper):
+            scraper.api_url = f"{base_url}/api/public/opportunity/search-result"
+        elif isinstance(scraper, DevpostScraper):
+            scraper.api_url = f"{base_url}/api/hackathons"
+
+async def bench_scrape(results: Dict, upstream: FakeUpstream, client: HttpClient):
+    manager = ScraperManager(client=client)
+    point_at(manager, upstream.base_url)
+
+    started = time.perf_counter()
+    events = await manager.get_all_events(fresh=True)
+    results['scrape_cold_s'] = time.perf_counter() - started
+
+    # Everything is cached upstream side now, every page answers 304
+    for scraper in manager.scrapers:
+        manager.poller.poll_now(scraper.name)
+    started = time.perf_counter()
+    await manager.get_all_events(fresh=True)
+    results['scrape_revalidate_s'] = time.perf_counter() - started
+    results['scrape_events'] = len(events)
+    await manager.close()
+
+def bench_normalize(results: Dict, count: int):
+    ctftime_raw = fixtures.ctftime_records(count)
+    unstop_raw = fixtures.unstop_records(count)
+    devpost_raw = fixtures.devpost_records(count)
+    ctftime, unstop, devpost = CTFTimeScraper(), UnstopScraper(), DevpostScraper()
+
+    elapsed, ctf_events = timed(ctftime._normalize, ctftime_raw)
+    results['normalize_ctftime_s'] = elapsed
+    elapsed, unstop_events = timed(unstop._normalize, unstop_raw)
+    results['normalize_unstop_s'] = elapsed
+    elapsed, _ = timed(devpost._normalize, devpost_raw)
+    results['normalize_devpost_s'] = elapsed
+    results['normalize_events_per_s'] = 3 * count / (
+        results['normalize_ctftime_s'] + results['normalize_unstop_s'] + results['normalize_devpost_s'])
+
+    elapsed, _ = timed(merge_events, ctf_events + unstop_events)
+    results['merge_s'] = elapsed
+
+async def make_cog(transport: FakeTransport, unthrottled: bool):
+    from bot.cogs.events import Events
+    bot = commands.Bot(command_prefix='!', intents=discord.Intents.default())
+    transport.attach(bot)
+    cog = Events(bot)
+    cog.check_new_events.cancel()
+    cog.start_scheduler.stop()
+    if unthrottled:
+        # Measure the pipeline's own cost, not Discord's rate limits
+        cog.delivery.global_bucket = TokenBucket(10 ** 9, 1.0)
+        cog.delivery._channel_bucket = lambda channel_id: cog.delivery.global_bucket
+    return cog
+
+async def bench_fanout(results: Dict, upstream: FakeUpstream, client: HttpClient, guilds: int, unthrottled: bool):
+    transport = FakeTransport()
+    cog = await make_cog(transport, unthrottled)
+    await cog.scraper_manager.close()
+    cog.scraper_manager = ScraperManager(client=client)
+    point_at(cog.scraper_manager, upstream.base_url)
+    cog.subscriptions = {str(1000 + g): 5000 + g for g in range(guilds)}
+
+    # Scrape, diff against the (empty) known index, render and deliver to every guild
+    started = time.perf_counter()
+    await cog.check_new_events.coro(cog)
+    results['fanout_s'] = time.perf_counter() - started
+    results['fanout_messages'] = transport.sent
+    results['fanout_messages_per_s'] = transport.sent / results['fanout_s'] if results['fanout_s'] else 0.0
+    await cog.cog_unload()
+
+async def bench_event_starts(results: Dict, guilds: int, per_guild: int):
+    transport = FakeTransport()
+    cog = await make_cog(transport, True)
+    keys = []
+    with cog.store._transaction():
+        for g in range(guilds):
+            guild_id = str(1000 + g)
+            for e in range(per_guild):
+                event_id = f"{e:016x}"
+                info = {
+                    'channel_id': 10 ** 6 + g * per_guild + e,
+                    'url': f"https://example.org/{e}",
+                    'title': f"Event {e}",
+                    'start_date': '2026-01-01T00:00:00+00:00',
+                    'notified_start': False,
+                }
+                cog.active_events.setdefault(guild_id, {})[event_id] = info
+                cog.store.upsert_active_event(guild_id, event_id, info)
+                keys.append((guild_id, event_id))
+
+    started = time.perf_counter()
+    await cog.check_event_starts(keys)
+    results['event_starts_s'] = time.perf_counter() - started
+    results['event_starts_pings'] = transport.sent
+    await cog.cog_unload()
+
+# Metrics where a bigger number is worse and a regression can be flagged
+TIMING_METRICS = (
+    'scrape_cold_s', 'scrape_revalidate_s', 'normalize_ctftime_s', 'normalize_unstop_s',
+    'normalize_devpost_s', 'merge_s', 'fanout_s', 'event_starts_s',
+)
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> bool:
+    ok = True
+    for name in TIMING_METRICS:
+        if name not in results or not baseline.get(name):
+            continue
+        ratio = results[name] / baseline[name]
+        marker = ''
+        if ratio > 1 + tolerance:
+            marker = '  <-- REGRESSION'
+            ok = False
+        print(f"{name:24} {baseline[name]:10.4f}s -> {results[name]:10.4f}s ({ratio:5.2f}x){marker}")
+    return ok
+
+async def main(args) -> Dict:
+    results = {}
+    upstream = FakeUpstream(
+        fixtures.ctftime_records(args.events),
+        fixtures.unstop_records(args.events),
+        fixtures.devpost_records(args.events),
+        latency=args.upstream_latency / 1000,
+    )
+    await upstream.start()
+    client = HttpClient()
+    try:
+        await bench_scrape(results, upstream, client)
+        bench_normalize(results, args.events)
+        await bench_fanout(results, upstream, client, args.guilds, not args.rate_limits)
+        await bench_event_starts(results, args.guilds, args.active)
+    finally:
+        await client.close()
+        await upstream.stop()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline EventBot benchmarks")
+    parser.add_argument('--events', type=int, default=200, help="events per upstream source")
+    parser.add_argument('--guilds', type=int, default=500, help="subscribed guilds for the fan-out")
+    parser.add_argument('--active', type=int, default=5, help="tracked events per guild for the start check")
+    parser.add_argument('--upstream-latency', type=float, default=0.0, help="simulated upstream latency in ms")
+    parser.add_argument('--rate-limits', action='store_true', help="keep Discord's rate limits in the fan-out")
+    parser.add_argument('--save', help="write the results to this JSON file")
+    parser.add_argument('--compare', help="baseline JSON file to check against")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    print(json.dumps(results, indent=2))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
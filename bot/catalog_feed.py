@@ -0,0 +1,66 @@
+from typing import List
+from scrapers.catalog import EventCatalog, filter_args
+from scrapers.models import Event
+from bot.storage import StateStore
+
+class CatalogFeed:
+    """
+    Event catalog fed by the ingest process (INGEST_MODE=external). Reads the diffs it
+    publishes to the state store instead of scraping, and answers the same queries as
+    ScraperManager so the cogs can use either.
+    """
+    def __init__(self, store: StateStore):
+        self.store = store
+        self.catalog = EventCatalog()
+        # Last change log entry applied, doubles as the catalog version
+        self.version = 0
+        self._loaded = False
+
+    async def close(self):
+        pass
+
+    def _reload(self):
+        self.version, events = self.store.load_catalog()
+        # Updated in place so the changes since the last drain stay recorded
+        self.catalog.update(events)
+        self._loaded = True
+
+    def sync(self):
+        """
+        Applies the diffs published since the last sync. Only the changed events are read.
+        """
+        if not self._loaded:
+            self._reload()
+            return
+
+        changes = self.store.catalog_changes_since(self.version)
+        if changes is None:
+            # Fell behind the trimmed change log, start over from the snapshot
+            print("Catalog change log trimmed past our position, reloading.")
+            self._reload()
+            return
+        if not changes:
+            return
+
+        # Later changes of the same event win
+        latest = {}
+        for seq, event_id, op in changes:
+            latest[event_id] = op
+        payloads = self.store.get_events(event_id for event_id, op in latest.items() if op == 'upsert')
+
+        events = {event.id: event for event in self.catalog.query()}
+        for event_id, op in latest.items():
+            if op == 'upsert' and event_id in payloads:
+                events[event_id] = payloads[event_id]
+            else:
+                events.pop(event_id, None)
+        self.catalog.update(events.values())
+        self.version = changes[-1][0]
+
+    async def get_all_events(self, type_filter: str = None, fresh: bool = False) -> List[Event]:
+        self.sync()
+        return self.catalog.query(**filter_args(type_filter))
+
+    async def get_events(self, type_filter: str = None, limit: int = None, start=None, end=None) -> List[Event]:
+        self.sync()
+        return self.catalog.query(start=start, end=end, limit=limit, **filter_args(type_filter))
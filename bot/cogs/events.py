@@ -1,36 +1,160 @@
 import discord
+import time
 from discord.ext import commands, tasks
-from scrapers.manager import ScraperManager
-from bot.utils import create_event_embed, create_events_summary_embed
-import json
-import os
-from datetime import datetime, timezone
-import dateutil.parser
+from bot.utils import create_event_embed, create_events_summary_embed, format_date, pack_embeds
+from scrapers.models import event_id_from_url
+from bot.storage import StateStore
+from bot.catalog_feed import CatalogFeed
+from bot.scheduler import StartScheduler, parse_timestamp
+from bot.known_events import KnownEventIndex
+from bot.delivery import DeliveryPipeline, DeliveryJob
+from bot.sharding import owns_guild, shard_scope
+from metrics import CHECK_SECONDS
+import config
 
+# Legacy JSON state, imported into the database once on first start
 SUBSCRIPTIONS_FILE = "data/subscriptions.json"
 KNOWN_EVENTS_FILE = "data/known_events.json"
 ACTIVE_EVENTS_FILE = "data/active_events.json"
 
+# Custom IDs carry the action and the event key, so the handlers survive restarts
+EVENT_ACTIONS = {
+    'create': ("Create Channel", discord.ButtonStyle.green, "➕"),
+    'delete': ("Delete Channel", discord.ButtonStyle.red, "➖"),
+}
+
+class EventButton(discord.ui.DynamicItem[discord.ui.Button], template=r'ev:(?P<action>create|delete):(?P<event_id>[0-9a-f]+)'):
+    def __init__(self, action, event_id):
+        label, style, emoji = EVENT_ACTIONS[action]
+        super().__init__(discord.ui.Button(label=label, style=style, emoji=emoji, custom_id=f"ev:{action}:{event_id}"))
+        self.action = action
+        self.event_id = event_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match['action'], match['event_id'])
+
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        await interaction.client.get_cog('Events').handle_event_action(interaction, self.action, self.event_id)
+
 class EventView(discord.ui.View):
-    def __init__(self, bot, event_data, event_cog):
+    def __init__(self, event_id):
         super().__init__(timeout=None)
-        self.bot = bot
-        self.event_data = event_data
-        self.event_cog = event_cog
+        self.add_item(EventButton('create', event_id))
+        self.add_item(EventButton('delete', event_id))
+
+class DigestSelect(discord.ui.DynamicItem[discord.ui.Select], template=r'ev:digest:(?P<action>create|delete)'):
+    def __init__(self, action, options, placeholder):
+        super().__init__(discord.ui.Select(
+            custom_id=f"ev:digest:{action}",
+            placeholder=placeholder,
+            options=options,
+            min_values=1,
+            max_values=1
+        ))
+        self.action = action
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Select, match):
+        return cls(match['action'], item.options, item.placeholder)
 
-    @discord.ui.button(label="Create Channel", style=discord.ButtonStyle.green, emoji="➕")
-    async def create_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
+        # Option values are event keys
+        await interaction.client.get_cog('Events').handle_event_action(interaction, self.action, self.item.values[0])
+
+class DigestView(discord.ui.View):
+    """
+    Per-event channel actions for a digest message carrying several event embeds.
+    """
+    def __init__(self, events):
+        super().__init__(timeout=None)
+        options = []
+        seen = set()
+        for event in events:
+            event_id = event.id
+            if event_id in seen:
+                continue
+            seen.add(event_id)
+            options.append(discord.SelectOption(
+                label=(event.title or 'Unknown Event')[:100],
+                value=event_id,
+                description=event.start.date().isoformat() if event.start else None
+            ))
+        self.add_item(DigestSelect('create', options, "➕ Create a channel for..."))
+        self.add_item(DigestSelect('delete', options, "➖ Delete the channel for..."))
+
+class Events(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.store = StateStore(config.STATE_DB_FILE)
+        if config.INGEST_MODE == 'external':
+            # Scraping runs in bot/ingest.py, only its published diffs are read here
+            self.scraper_manager = CatalogFeed(self.store)
+        else:
+            # Imported here, processes fed by the ingest process never load the scraper modules
+            from scrapers.manager import ScraperManager
+            # Commands answer from the last snapshot right after a restart
+            self.scraper_manager = ScraperManager(snapshot_path=config.CATALOG_SNAPSHOT_FILE)
+        self.store.migrate_from_json(SUBSCRIPTIONS_FILE, KNOWN_EVENTS_FILE, ACTIVE_EVENTS_FILE, event_id_from_url)
+        # In-memory views of the store for fast reads, writes go through row by row
+        self.subscriptions = self.store.load_subscriptions()
+        # Shard-group processes share the database but each announces to its own guilds
+        self.known_scope = shard_scope(bot)
+        self.known_events = KnownEventIndex(self.store.load_known_events(self.known_scope, KnownEventIndex.expiry_for(None)))
+        self.active_events = self.store.load_active_events() # Structure: {guild_id: {event_id: {data}}}
+        self._seen_catalog_version = None
+        # Tracked events already flagged as unlisted, warned about once until they reappear
+        self._unlisted = set() # Structure: {(guild_id, event_id)}
+        self.delivery = DeliveryPipeline(bot, self.store)
+
+        self.start_scheduler = StartScheduler(self.check_event_starts)
+        for guild_id, events_map in self.active_events.items():
+            for event_id, info in events_map.items():
+                if not info.get('notified_start'):
+                    self._schedule_start(guild_id, event_id, info)
         
+        # Start background tasks
+        self.check_new_events.start()
+        self.start_scheduler.start(wait_until=self.bot.wait_until_ready)
+
+    async def cog_unload(self):
+        self.check_new_events.cancel()
+        self.start_scheduler.stop()
+        await self.scraper_manager.close()
+        self.store.close()
+
+    # --- Event Channels ---
+    async def handle_event_action(self, interaction: discord.Interaction, action, event_id):
+        """
+        Entry point for the persistent buttons and selects. Event data is looked up by key
+        in the state store. The interaction must already be deferred.
+        """
+        event_data = self.store.get_event(event_id)
+        if event_data is None:
+            await interaction.followup.send("That event is no longer available.", ephemeral=True)
+            return
+
+        if action == 'create':
+            await self.create_event_channel(interaction, event_data)
+        else:
+            await self.delete_event_channel(interaction, event_data)
+
+    async def create_event_channel(self, interaction: discord.Interaction, event_data):
+        """
+        Creates and registers a discussion channel for the event. The interaction must already be deferred.
+        """
         guild_id = str(interaction.guild_id)
-        event_url = self.event_data.get('url')
+        event_url = event_data.url
+        event_id = event_data.id
         
-        if self.event_cog.get_channel_id(guild_id, event_url):
+        if self.get_channel_id(guild_id, event_id):
             await interaction.followup.send("A channel for this event already exists!", ephemeral=True)
             return
 
         # Sanitize channel name
-        title = self.event_data.get('title', 'event')
+        title = event_data.title or 'event'
         sanitized_title = "".join(c if c.isalnum() else "-" for c in title).lower()
         channel_name = f"ctf-{sanitized_title}"[:30].strip("-")
         
@@ -44,25 +168,25 @@ class EventView(discord.ui.View):
             )
             
             # Post Event Info
-            embed = create_event_embed(self.event_data)
+            embed = create_event_embed(event_data)
             await channel.send(f"Welcome to the war room for **{title}**! @here", embed=embed)
             
             # Register active event
-            self.event_cog.add_active_event(guild_id, event_url, channel.id, self.event_data)
+            self.add_active_event(guild_id, event_id, channel.id, event_data)
             
             await interaction.followup.send(f"✅ Created channel {channel.mention}!", ephemeral=True)
             
         except Exception as e:
             await interaction.followup.send(f"Failed to create channel: {str(e)}", ephemeral=True)
 
-    @discord.ui.button(label="Delete Channel", style=discord.ButtonStyle.red, emoji="➖")
-    async def delete_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await interaction.response.defer(ephemeral=True)
-        
+    async def delete_event_channel(self, interaction: discord.Interaction, event_data):
+        """
+        Deletes the event's tracked channel. The interaction must already be deferred.
+        """
         guild_id = str(interaction.guild_id)
-        event_url = self.event_data.get('url') # URL acts as ID
+        event_id = event_data.id
         
-        channel_id = self.event_cog.get_channel_id(guild_id, event_url)
+        channel_id = self.get_channel_id(guild_id, event_id)
         
         if not channel_id:
             await interaction.followup.send("No tracked channel found for this event.", ephemeral=True)
@@ -73,67 +197,41 @@ class EventView(discord.ui.View):
         if channel:
             try:
                 await channel.delete(reason="User requested event channel deletion")
-                self.event_cog.remove_active_event(guild_id, event_url)
+                self.remove_active_event(guild_id, event_id)
                 await interaction.followup.send("Channel deleted.", ephemeral=True)
             except Exception as e:
                 await interaction.followup.send(f"Failed to delete channel: {e}", ephemeral=True)
         else:
             # Channel already gone, just clean up DB
-            self.event_cog.remove_active_event(guild_id, event_url)
+            self.remove_active_event(guild_id, event_id)
             await interaction.followup.send("Channel record cleaned up (channel was missing).", ephemeral=True)
 
-class Events(commands.Cog):
-    def __init__(self, bot):
-        self.bot = bot
-        self.scraper_manager = ScraperManager()
-        self.subscriptions = self._load_json(SUBSCRIPTIONS_FILE, {})
-        self.known_events = set(self._load_json(KNOWN_EVENTS_FILE, []))
-        self.active_events = self._load_json(ACTIVE_EVENTS_FILE, {}) # Structure: {guild_id: {event_url: {data}}}
-        
-        # Start background tasks
-        self.check_new_events.start()
-        self.check_event_starts.start()
-
-    def cog_unload(self):
-        self.check_new_events.cancel()
-        self.check_event_starts.cancel()
-
-    def _load_json(self, filename, default):
-        if os.path.exists(filename):
-            try:
-                with open(filename, 'r') as f:
-                    return json.load(f)
-            except:
-                return default
-        return default
-
-    def _save_json(self, filename, data):
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, 'w') as f:
-            json.dump(data, f, default=str)
-
     # --- Active Event Management ---
-    def get_channel_id(self, guild_id, event_url):
-        return self.active_events.get(str(guild_id), {}).get(event_url, {}).get('channel_id')
+    def get_channel_id(self, guild_id, event_id):
+        return self.active_events.get(str(guild_id), {}).get(event_id, {}).get('channel_id')
 
-    def add_active_event(self, guild_id, event_url, channel_id, event_data):
+    def add_active_event(self, guild_id, event_id, channel_id, event_data):
         guild_id = str(guild_id)
         if guild_id not in self.active_events:
             self.active_events[guild_id] = {}
         
-        self.active_events[guild_id][event_url] = {
+        info = {
             "channel_id": channel_id,
-            "title": event_data.get('title'),
-            "start_date": event_data.get('start_date'),
+            "url": event_data.url,
+            "title": event_data.title,
+            "start_date": event_data.start.isoformat() if event_data.start else None,
             "notified_start": False
         }
-        self._save_json(ACTIVE_EVENTS_FILE, self.active_events)
+        self.active_events[guild_id][event_id] = info
+        self.store.upsert_active_event(guild_id, event_id, info)
+        self._schedule_start(guild_id, event_id, info)
 
-    def remove_active_event(self, guild_id, event_url):
+    def remove_active_event(self, guild_id, event_id):
         guild_id = str(guild_id)
-        if guild_id in self.active_events and event_url in self.active_events[guild_id]:
-            del self.active_events[guild_id][event_url]
-            self._save_json(ACTIVE_EVENTS_FILE, self.active_events)
+        if guild_id in self.active_events and event_id in self.active_events[guild_id]:
+            del self.active_events[guild_id][event_id]
+            self.store.delete_active_event(guild_id, event_id)
+            self.start_scheduler.cancel((guild_id, event_id))
 
     # --- Commands ---
 
@@ -149,19 +247,23 @@ class Events(commands.Cog):
 
     async def _send_events(self, ctx, limit, type_filter):
         try:
-            events = self.scraper_manager.get_all_events(type_filter=type_filter)
-            
-            if not events:
-                await ctx.send(f"No upcoming {type_filter} events found.")
-                return
-
             if limit > 0:
-                subset = events[:limit]
+                # Only the requested events are pulled out of the catalog
+                subset = await self.scraper_manager.get_events(type_filter=type_filter, limit=limit)
+                if not subset:
+                    await ctx.send(f"No upcoming {type_filter} events found.")
+                    return
+                # Buttons only carry the event key, the data lives in the store
+                self.store.save_events(subset)
                 for event in subset:
                     embed = create_event_embed(event)
-                    view = EventView(self.bot, event, self)
+                    view = EventView(event.id)
                     await ctx.send(embed=embed, view=view)
             else:
+                events = await self.scraper_manager.get_all_events(type_filter=type_filter)
+                if not events:
+                    await ctx.send(f"No upcoming {type_filter} events found.")
+                    return
                 embed = create_events_summary_embed(events)
                 await ctx.send(embed=embed)
             
@@ -174,98 +276,247 @@ class Events(commands.Cog):
         guild_id = str(ctx.guild.id)
         channel_id = ctx.channel.id
         
+        self.store.set_subscription(guild_id, channel_id)
         self.subscriptions[guild_id] = channel_id
-        self._save_json(SUBSCRIPTIONS_FILE, self.subscriptions)
         
         await ctx.send(f"✅ checks enabled! I will post new events to {ctx.channel.mention}.")
 
     # --- Tasks ---
 
-    @tasks.loop(minutes=1)
-    async def check_event_starts(self):
-        if not self.bot.is_ready(): return
-        
-        now = datetime.now(timezone.utc)
-        
-        # Iterate over all guilds and events
-        # Note: Iterate over copy to allow modification
-        changes = False
+    def _schedule_start(self, guild_id, event_id, info):
+        # Parse once here, the scheduler only deals with timestamps
+        start_ts = parse_timestamp(info.get('start_date'))
+        if start_ts is None:
+            return
+        self.start_scheduler.schedule((guild_id, event_id), start_ts)
+
+    async def check_event_starts(self, keys):
+        """
+        Called by the start scheduler with the (guild_id, event_id) pairs whose start time has passed.
+        """
+        started = []
         
-        for guild_id, events_map in self.active_events.items():
-            for event_url, info in events_map.items():
-                if info.get('notified_start'):
-                    continue
+        for guild_id, event_id in keys:
+            if not owns_guild(self.bot, guild_id):
+                # Another shard process sends this one
+                continue
+            info = self.active_events.get(guild_id, {}).get(event_id)
+            if not info or info.get('notified_start'):
+                continue
+            
+            try:
+                # EVENT STARTED
+                channel_id = info.get('channel_id')
+                channel = self.bot.get_channel(channel_id)
                 
-                try:
-                    start_str = info.get('start_date')
-                    if not start_str: continue
-                    
-                    # Parse start time
-                    start_dt = dateutil.parser.isoparse(start_str)
-                    
-                    # If offset naive, assume UTC (though API usually returns iso with offset)
-                    if start_dt.tzinfo is None:
-                        start_dt = start_dt.replace(tzinfo=timezone.utc)
-                        
-                    if now >= start_dt:
-                        # EVENT STARTED
-                        channel_id = info.get('channel_id')
-                        channel = self.bot.get_channel(channel_id)
-                        
-                        if channel:
-                            await channel.send(f"@everyone 🚨 **CTF STARTED!** 🚨\nThe event **{info.get('title')}** has begun! Go go go!")
-                        
-                        info['notified_start'] = True
-                        changes = True
-                        
-                except Exception as e:
-                    print(f"Error checking start for {event_url}: {e}")
+                if channel:
+                    await channel.send(f"@everyone 🚨 **CTF STARTED!** 🚨\nThe event **{info.get('title')}** has begun! Go go go!")
+                
+            except Exception as e:
+                print(f"Error sending start notification for {info.get('url') or event_id}: {e}")
+            
+            info['notified_start'] = True
+            started.append((guild_id, event_id))
         
-        if changes:
-            self._save_json(ACTIVE_EVENTS_FILE, self.active_events)
+        if started:
+            self.store.mark_started(started)
 
-    @tasks.loop(minutes=60)
+    # The tick is cheap: in external mode only published diffs are read, inline the
+    # scraper manager only refetches the sources its poller says are due
+    @tasks.loop(minutes=1)
     async def check_new_events(self):
         if not self.bot.is_ready(): return
 
-        print("Checking for new events...")
+        started = time.perf_counter()
         try:
-            current_events = self.scraper_manager.get_all_events()
+            current_events = await self.scraper_manager.get_all_events(fresh=True)
+
+            # Every source answered 304 or sent identical bytes, nothing to diff
+            if self.scraper_manager.version == self._seen_catalog_version:
+                return
+            print("Upstream changed, checking for new events...")
+            version = self.scraper_manager.version
+
+            # Corrections to events guilds already track go out as targeted updates
+            changes = self.scraper_manager.catalog.drain_changes()
+            if changes:
+                await self._apply_event_changes(changes, current_events)
+
+            now = time.time()
             new_events = []
+            new_known = []
+            extended = []
             
             for event in current_events:
-                # Use URL as a unique identifier
-                event_id = event.get('url')
-                if not event_id: continue
+                # Stable IDs derived from the URLs
+                ids = event.all_ids()
+                if not ids: continue
                 
-                if event_id not in self.known_events:
+                expires_at = KnownEventIndex.expiry_for(event.end_ts, now)
+                # The canonical ID moves when the first source drops out, any known URL counts
+                if not any(event_id in self.known_events for event_id in ids):
                     new_events.append(event)
-                    self.known_events.add(event_id)
+                for event_id, url in ids.items():
+                    if event_id not in self.known_events:
+                        new_known.append((event_id, url, expires_at))
+                    elif self.known_events.needs_extension(event_id, expires_at):
+                        # Still listed, e.g. no end date: it must not expire and be announced again
+                        extended.append((event_id, expires_at))
+
+            # The store is written before memory and the seen version move on, so a failed
+            # write leaves these events new and the next tick retries them
+            if extended:
+                self.store.extend_known_events(self.known_scope, extended)
+            if new_events:
+                # Payloads first, a known event must always be loadable by its buttons
+                self.store.save_events(new_events)
+            if new_known:
+                self.store.add_known_events(self.known_scope, new_known)
+            for event_id, _, expires_at in new_known:
+                self.known_events.add(event_id, expires_at)
+            for event_id, expires_at in extended:
+                self.known_events.add(event_id, expires_at)
+
+            # Forget events that ended a while ago, keeps the index from growing forever
+            if self.store.prune_known_events(now):
+                # Their payloads go too, unless a tracked event or the published catalog still needs them
+                self.store.prune_events()
+            self.known_events.prune(now)
+            self._seen_catalog_version = version
             
             if new_events:
                 print(f"Found {len(new_events)} new events!")
-                self._save_json(KNOWN_EVENTS_FILE, list(self.known_events))
                 
-                for guild_id, channel_id in self.subscriptions.items():
-                    channel = self.bot.get_channel(channel_id)
-                    if channel:
-                        for event in new_events:
-                            embed = create_event_embed(event)
-                            view = EventView(self.bot, event, self)
-                            await channel.send("🚨 **New Event Detected!**", embed=embed, view=view)
+                # Render each message once, the same embeds and view are shared by every guild
+                messages = self._build_notifications(new_events)
+                jobs = [
+                    DeliveryJob(guild_id, channel_id, event_id, **kwargs)
+                    for guild_id, channel_id in self.subscriptions.items()
+                    if owns_guild(self.bot, guild_id)
+                    for event_id, kwargs in messages
+                ]
+                sent, failed = await self.delivery.deliver(jobs)
+                print(f"Delivered {sent} notifications ({failed} failed).")
             else:
                 print("No new events found.")
                 
         except Exception as e:
             print(f"Error in background task: {e}")
+        finally:
+            CHECK_SECONDS.observe(time.perf_counter() - started)
+
+    async def _apply_event_changes(self, changes, current_events):
+        """
+        Pushes catalog changes to the guilds tracking the affected events: moved start times
+        are rescheduled and announced in the event channel, events that disappear before
+        starting get a one-time warning but keep their start ping. Tracked events are matched
+        by any of their IDs, a channel keeps following its event when the canonical ID moves.
+        """
+        if changes.updated:
+            # Buttons on older messages read the event from the store
+            self.store.save_events(new for _, new, _ in changes.updated)
+
+        watchers = {} # Structure: {event_id: [(guild_id, info)]}
+        for guild_id, events_map in self.active_events.items():
+            if owns_guild(self.bot, guild_id):
+                for event_id, info in events_map.items():
+                    watchers.setdefault(event_id, []).append((guild_id, info))
+        if not watchers:
+            return
+
+        current_by_id = {event_id: event for event in current_events for event_id in event.all_ids()}
+        for event in changes.removed:
+            # An event that lost its first source comes back under another ID, the old one
+            # is only listed on the removed record
+            ids = event.all_ids()
+            successor = next((current_by_id[event_id] for event_id in ids if event_id in current_by_id), None)
+            if successor is not None:
+                for event_id in ids:
+                    current_by_id.setdefault(event_id, successor)
+
+        now = time.time()
+        notices = [] # Structure: [(channel_id, message)]
+        # Added events are checked too, a change made while the bot was down shows up as one
+        changed = {id(event) for event in changes.added + [new for _, new, _ in changes.updated]}
+        for tracked_id, guild_infos in watchers.items():
+            event = current_by_id.get(tracked_id)
+            if event is None or id(event) not in changed:
+                continue
+            for guild_id, info in guild_infos:
+                key = (guild_id, tracked_id)
+                # Compared as timestamps, the same instant may come with another UTC offset
+                moved = parse_timestamp(info.get('start_date')) != event.start_ts
+                if moved or event.title != info.get('title'):
+                    info['title'] = event.title
+                    if moved:
+                        info['start_date'] = event.start.isoformat() if event.start else None
+                        if event.start_ts is not None and event.start_ts > now:
+                            # Postponed after the ping went out, ping again at the new time
+                            info['notified_start'] = False
+                        self.start_scheduler.cancel(key)
+                        notices.append((info['channel_id'],
+                            f"📅 **{event.title}** was rescheduled, it now starts {format_date(event.start) or 'on a date still to be announced'}."))
+                    self.store.upsert_active_event(guild_id, tracked_id, info)
+                self._unlisted.discard(key)
+                if not info.get('notified_start'):
+                    self._schedule_start(guild_id, tracked_id, info)
+
+        for event in changes.removed:
+            # Events that started simply drop out of the listings
+            if event.start_ts is None or event.start_ts <= now:
+                continue
+            ids = event.all_ids()
+            if any(event_id in current_by_id for event_id in ids):
+                # Still listed under another ID
+                continue
+            # Listings also drop events when registration closes or they slide past the page
+            # cap, so this is no proof of a cancellation: the start ping stays scheduled
+            for tracked_id in ids:
+                for guild_id, info in watchers.get(tracked_id, ()):
+                    key = (guild_id, tracked_id)
+                    if info.get('notified_start') or key in self._unlisted:
+                        continue
+                    self._unlisted.add(key)
+                    notices.append((info['channel_id'],
+                        f"⚠️ **{info.get('title')}** is no longer listed upstream. Registration may have closed, "
+                        f"or it may have been cancelled; check the event page. The start ping stays scheduled."))
+
+        for channel_id, message in notices:
+            channel = self.bot.get_channel(channel_id)
+            if channel:
+                try:
+                    await channel.send(message)
+                except Exception as e:
+                    print(f"Error sending event update to {channel_id}: {e}")
+
+    def _build_notifications(self, new_events):
+        """
+        Returns (event_id, send kwargs) per message. A single event keeps its own message with
+        buttons, several events are packed into digest messages with select menus.
+        """
+        if len(new_events) == 1:
+            event = new_events[0]
+            return [(event.id, {
+                'content': "🚨 **New Event Detected!**",
+                'embed': create_event_embed(event),
+                'view': EventView(event.id)
+            })]
+
+        embeds = [create_event_embed(event) for event in new_events]
+        messages = []
+        for start, end in pack_embeds(embeds):
+            chunk = new_events[start:end]
+            messages.append((None, {
+                'content': f"🚨 **{len(chunk)} New Events Detected!**",
+                'embeds': embeds[start:end],
+                'view': DigestView(chunk)
+            }))
+        return messages
 
     @check_new_events.before_loop
     async def before_check_new_events(self):
         await self.bot.wait_until_ready()
-        
-    @check_event_starts.before_loop
-    async def before_check_event_starts(self):
-        await self.bot.wait_until_ready()
 
 async def setup(bot):
+    bot.add_dynamic_items(EventButton, DigestSelect)
     await bot.add_cog(Events(bot))
@@ -1,70 +1,45 @@
 import discord
 from discord.ext import commands
-import aiohttp
-from bs4 import BeautifulSoup
+from bot.team_stats import TeamStatsService, TeamStatsError, team_url
+from bot.storage import StateStore
 import config
+import metrics
+
+def _format_timing(histogram: metrics.Histogram, **labels) -> str:
+    series = histogram.series(**labels)
+    if series is None or not series.count:
+        return "no data"
+    return (f"{series.count}× avg {series.sum / series.count * 1000:.0f}ms, "
+            f"p95 ≤{histogram.quantile(0.95, **labels) * 1000:.0f}ms, max {series.max * 1000:.0f}ms")
 
 class Stats(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.team_stats = TeamStatsService()
+        self.store = StateStore(config.STATE_DB_FILE)
+
+    async def cog_unload(self):
+        await self.team_stats.close()
+        self.store.close()
+
+    @commands.hybrid_command(name="setteam", description="Set the CTFtime team tracked by /top10 in this server")
+    @commands.has_permissions(administrator=True)
+    async def setteam(self, ctx, team_id: int):
+        self.store.set_team_id(ctx.guild.id, str(team_id))
+        await ctx.send(f"✅ /top10 will now show CTFtime team {team_id}.")
 
     @commands.hybrid_command(name="top10", description="List top 10 CTFtime events for the team")
-    async def top10(self, ctx):
+    async def top10(self, ctx, team_id: int = None):
         await ctx.defer()
         
-        team_id = config.CTFTIME_TEAM_ID
-        url = f'https://ctftime.org/team/{team_id}'
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        # Explicit argument, then the server's team, then the global default
+        if team_id is None and ctx.guild is not None:
+            team_id = self.store.get_team_id(ctx.guild.id)
+        team_id = str(team_id or config.CTFTIME_TEAM_ID)
+        url = team_url(team_id)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        await ctx.send(f"Failed to fetch data from CTFtime (Status: {response.status})")
-                        return
-                    html = await response.text()
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            table = soup.find('table', class_='table-striped')
-
-            if not table:
-                await ctx.send("Could not find events table on CTFtime page.")
-                return
-
-            data = []
-            rows = table.find_all('tr')
-            
-            # Skip header row
-            for row in rows[1:]:
-                cols = row.find_all('td')
-                if len(cols) >= 5: # Ensure enough columns
-                    try:
-                        place = cols[1].text.strip()
-                        event_name = cols[2].text.strip()
-                        # event_link = cols[2].find('a')['href'] if cols[2].find('a') else None
-                        
-                        # Handle potential non-numeric weight/points 
-                        # User script: ctf_points = float(cols[3].text.strip()) -> This is usually "CTF points"
-                        # User script: rating_points = float(cols[4].text.strip().replace("*", "")) -> This is "Rating points"
-                        
-                        rating_str = cols[4].text.strip().replace("*", "")
-                        if not rating_str:
-                            rating_points = 0.0
-                        else:
-                            rating_points = float(rating_str)
-
-                        data.append({
-                            'place': place,
-                            'event_name': event_name,
-                            'rating_points': rating_points
-                        })
-                    except ValueError:
-                        continue # Skip rows with bad data
-
-            # Sort by rating points descending
-            data.sort(key=lambda x: x['rating_points'], reverse=True)
+            data = await self.team_stats.get_results(team_id)
             
             top_10 = data[:10]
             total_rating = sum(item['rating_points'] for item in top_10)
@@ -95,8 +70,43 @@ class Stats(commands.Cog):
 
             await ctx.send(embed=embed)
 
+        except TeamStatsError as e:
+            await ctx.send(str(e))
         except Exception as e:
             await ctx.send(f"An error occurred while fetching stats: {str(e)}")
 
+    @commands.hybrid_command(name="botstats", description="Show scraper, delivery and storage metrics")
+    @commands.has_permissions(administrator=True)
+    async def botstats(self, ctx):
+        embed = discord.Embed(title="📊 Bot Stats", color=0x5865F2)
+
+        scrapes = []
+        for labels in metrics.SCRAPE_SECONDS.label_sets():
+            scrapes.append(f"**{labels['source']}** ({labels['outcome']}): {_format_timing(metrics.SCRAPE_SECONDS, **labels)}")
+        embed.add_field(name="Scrapers", value="\n".join(scrapes) or "no data", inline=False)
+
+        # Only the inline scraper manager polls, in external mode the ingest process does
+        poller = getattr(getattr(self.bot.get_cog('Events'), 'scraper_manager', None), 'poller', None)
+        if poller is not None:
+            intervals = [f"**{name}**: every {interval / 60:.0f} min" for name, interval in poller.intervals().items()]
+            embed.add_field(name="Poll intervals", value="\n".join(intervals), inline=False)
+
+        ratio = metrics.cache_hit_ratio()
+        embed.add_field(name="Cache hit ratio (commands)", value=f"{ratio:.0%}" if ratio is not None else "no data")
+        embed.add_field(name="Deliveries",
+                        value=f"{metrics.DELIVERIES.value(result='sent'):.0f} sent, {metrics.DELIVERIES.value(result='failed'):.0f} failed")
+        embed.add_field(name="Gateway latency", value=f"{self.bot.latency * 1000:.0f}ms")
+
+        embed.add_field(name="Send latency", value=_format_timing(metrics.SEND_SECONDS), inline=False)
+        waits = [f"{bucket}: {_format_timing(metrics.RATE_LIMIT_WAIT_SECONDS, bucket=bucket)}" for bucket in ('channel', 'global')]
+        embed.add_field(name="Rate limit waits", value="\n".join(waits), inline=False)
+        embed.add_field(name="Scheduler lag", value=_format_timing(metrics.SCHEDULER_LAG_SECONDS), inline=False)
+        writes = [f"{labels['op']}: {_format_timing(metrics.STORE_WRITE_SECONDS, **labels)}"
+                  for labels in metrics.STORE_WRITE_SECONDS.label_sets()]
+        embed.add_field(name="Store writes", value="\n".join(writes) or "no data", inline=False)
+        embed.add_field(name="New event checks", value=_format_timing(metrics.CHECK_SECONDS), inline=False)
+
+        await ctx.send(embed=embed, ephemeral=True)
+
 async def setup(bot):
     await bot.add_cog(Stats(bot))
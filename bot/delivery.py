@@ -0,0 +1,138 @@
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+import aiohttp
+import discord
+from metrics import DELIVERIES, RATE_LIMIT_WAIT_SECONDS, SEND_SECONDS
+
+# Discord allows 50 requests/s globally and 5 messages per 5s on each channel route
+GLOBAL_RATE = 50
+CHANNEL_RATE = 5
+CHANNEL_PER = 5.0
+MAX_ATTEMPTS = 3
+
+class TokenBucket:
+    """
+    Async token bucket, acquire() waits until a token is available.
+    """
+    def __init__(self, capacity: int, per: float):
+        self.capacity = capacity
+        self.rate = capacity / per
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """
+        Takes one token and returns how long the caller had to wait for it.
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+class DeliveryJob:
+    __slots__ = ('guild_id', 'channel_id', 'event_id', 'kwargs')
+
+    def __init__(self, guild_id: str, channel_id: int, event_id: Optional[str], **kwargs):
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.event_id = event_id
+        # Passed straight to channel.send
+        self.kwargs = kwargs
+
+class DeliveryPipeline:
+    """
+    Sends a batch of messages with a bounded pool of workers. Messages for the same channel
+    are sent in order by a single worker; every send goes through the channel's bucket and
+    the global bucket, failures are retried with backoff and then recorded in the store.
+    """
+    def __init__(self, bot, store, workers: int = 16):
+        self.bot = bot
+        self.store = store
+        self.workers = workers
+        self.global_bucket = TokenBucket(GLOBAL_RATE, 1.0)
+        self._channel_buckets: Dict[int, TokenBucket] = {}
+
+    def _channel_bucket(self, channel_id: int) -> TokenBucket:
+        bucket = self._channel_buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._channel_buckets[channel_id] = TokenBucket(CHANNEL_RATE, CHANNEL_PER)
+        return bucket
+
+    async def deliver(self, jobs: List[DeliveryJob]) -> Tuple[int, int]:
+        """
+        Delivers every job and returns (sent, failed).
+        """
+        by_channel: Dict[int, List[DeliveryJob]] = {}
+        for job in jobs:
+            by_channel.setdefault(job.channel_id, []).append(job)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for channel_jobs in by_channel.values():
+            queue.put_nowait(channel_jobs)
+
+        failures: List[Tuple[DeliveryJob, str]] = []
+        counts = {'sent': 0}
+
+        async def worker():
+            while True:
+                try:
+                    channel_jobs = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                for job in channel_jobs:
+                    error = await self._send(job)
+                    if error is None:
+                        counts['sent'] += 1
+                    else:
+                        failures.append((job, error))
+
+        await asyncio.gather(*(worker() for _ in range(min(self.workers, len(by_channel)))))
+
+        if failures:
+            self.store.record_failed_deliveries(
+                (job.guild_id, job.channel_id, job.event_id, error) for job, error in failures
+            )
+        DELIVERIES.inc(counts['sent'], result='sent')
+        DELIVERIES.inc(len(failures), result='failed')
+        return counts['sent'], len(failures)
+
+    async def _send(self, job: DeliveryJob) -> Optional[str]:
+        """
+        Returns None on success, otherwise the error that made the delivery fail.
+        """
+        channel = self.bot.get_channel(job.channel_id)
+        if channel is None:
+            return "channel not found"
+
+        error = None
+        for attempt in range(MAX_ATTEMPTS):
+            RATE_LIMIT_WAIT_SECONDS.observe(await self._channel_bucket(job.channel_id).acquire(), bucket='channel')
+            RATE_LIMIT_WAIT_SECONDS.observe(await self.global_bucket.acquire(), bucket='global')
+            try:
+                with SEND_SECONDS.time():
+                    await channel.send(**job.kwargs)
+                return None
+            except (discord.Forbidden, discord.NotFound) as e:
+                # Permanent, retrying will not help
+                return f"{type(e).__name__}: {e}"
+            except discord.HTTPException as e:
+                if e.status != 429 and e.status < 500:
+                    return f"HTTP {e.status}: {e}"
+                error = f"HTTP {e.status}: {e}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = f"{type(e).__name__}: {e}"
+
+            # Exponential backoff with full jitter
+            await asyncio.sleep(random.uniform(0, 2 ** attempt))
+        return error
@@ -0,0 +1,92 @@
+import sys
+import os
+
+# Add parent directory to sys.path to allow importing config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import json
+import time
+import config
+import metrics
+from bot.storage import INGEST_BUSY_TIMEOUT_MS, StateStore
+from scrapers.http_client import close_client
+from scrapers.manager import ScraperManager
+
+# Change log entries older than this are trimmed, a bot down for longer reloads the snapshot
+CHANGE_LOG_RETENTION = 24 * 60 * 60
+# Sources come due at different times, this keeps near simultaneous ones in one cycle
+MIN_SLEEP = 5.0
+
+class Ingest:
+    """
+    Runs the scrapers outside the Discord process (INGEST_MODE=external) and publishes
+    catalog diffs to the state store, where the bot's CatalogFeed picks them up.
+    Both processes must open the same STATE_DB_FILE, so they have to run on the same
+    host or share one volume.
+    """
+    def __init__(self, store: StateStore, interval: float):
+        self.store = store
+        self.interval = interval
+        self.manager = ScraperManager(ttl=interval)
+        self._published = {} # Structure: {event_id: serialized payload}
+        self._seen_version = None
+
+    def _load_published(self):
+        _, events = self.store.load_catalog()
+        self._published = {event.id: json.dumps(event.to_dict()) for event in events}
+
+    async def run_once(self):
+        events = await self.manager.get_all_events(fresh=True)
+        if self.manager.version == self._seen_version:
+            return
+        self._seen_version = self.manager.version
+
+        current = {event.id: event for event in events if event.id}
+        payloads = {event_id: json.dumps(event.to_dict()) for event_id, event in current.items()}
+        upserts = [current[event_id] for event_id, payload in payloads.items() if self._published.get(event_id) != payload]
+        removed = [event_id for event_id in self._published if event_id not in current]
+        if not upserts and not removed:
+            return
+
+        seq = self.store.publish_catalog(upserts, removed)
+        self._published = payloads
+        print(f"Published catalog diff #{seq}: {len(upserts)} upserted, {len(removed)} removed.")
+
+    async def run(self):
+        self._load_published()
+        while True:
+            started = time.monotonic()
+            try:
+                await self.run_once()
+                self.store.trim_catalog_changes(time.time() - CHANGE_LOG_RETENTION)
+            except Exception as e:
+                print(f"Error in ingest cycle: {e}")
+            # Wake up for the next source that is due, at least once per interval
+            await asyncio.sleep(max(MIN_SLEEP, min(self.interval - (time.monotonic() - started), self.manager.next_poll_in())))
+
+    async def close(self):
+        await self.manager.close()
+        await close_client()
+        self.store.close()
+
+async def main():
+    if config.INGEST_MODE != 'external':
+        print("INGEST_MODE is not 'external', the bot scrapes by itself. Exiting.")
+        return
+    ingest = Ingest(StateStore(config.STATE_DB_FILE, INGEST_BUSY_TIMEOUT_MS), config.INGEST_INTERVAL)
+    metrics_runner = None
+    if config.INGEST_METRICS_PORT:
+        metrics_runner = await metrics.start_server(config.METRICS_HOST, config.INGEST_METRICS_PORT)
+    try:
+        await ingest.run()
+    finally:
+        await ingest.close()
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
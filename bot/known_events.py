@@ -0,0 +1,54 @@
+import time
+from typing import Dict, List, Optional
+
+# Keep an event this long after it ends, listings can lag behind the real end date
+EXPIRY_GRACE = 7 * 24 * 60 * 60
+# Expiry for events without an end date
+DEFAULT_LIFETIME = 90 * 24 * 60 * 60
+# Expiries of listed events are only rewritten once they would move by more than this
+EXTEND_SLACK = 24 * 60 * 60
+
+def _key(event_id: str) -> int:
+    # Event IDs are hex digests, an int is far smaller in memory than the string
+    return int(event_id, 16)
+
+class KnownEventIndex:
+    """
+    Compact set of already announced events. Maps the hashed event ID to the time the
+    entry expires, so events that are long over can be pruned and the index stays flat.
+    """
+    def __init__(self, entries: Dict[str, float] = None):
+        self._expiry: Dict[int, float] = {_key(event_id): expires_at for event_id, expires_at in (entries or {}).items()}
+
+    def __len__(self):
+        return len(self._expiry)
+
+    def __contains__(self, event_id: str) -> bool:
+        return _key(event_id) in self._expiry
+
+    @staticmethod
+    def expiry_for(end_ts: Optional[float], now: float = None) -> float:
+        if end_ts is not None:
+            return end_ts + EXPIRY_GRACE
+        return (now or time.time()) + DEFAULT_LIFETIME
+
+    def add(self, event_id: str, expires_at: float):
+        self._expiry[_key(event_id)] = expires_at
+
+    def needs_extension(self, event_id: str, expires_at: float) -> bool:
+        """
+        True if pushing a still listed event's expiry out to expires_at moves it by more than
+        EXTEND_SLACK, so callers only persist meaningful changes. The index is left as is,
+        add() the new expiry once it is stored.
+        """
+        return expires_at - self._expiry.get(_key(event_id), 0) > EXTEND_SLACK
+
+    def prune(self, now: float = None) -> int:
+        """
+        Drops expired entries and returns how many were removed.
+        """
+        now = now or time.time()
+        expired: List[int] = [key for key, expires_at in self._expiry.items() if expires_at < now]
+        for key in expired:
+            del self._expiry[key]
+        return len(expired)
@@ -8,25 +8,72 @@ import discord
 from discord.ext import commands
 import config
 import asyncio
+import hashlib
+import json
+import metrics
+from bot.storage import StateStore
+from scrapers.http_client import close_client
 
 intents = discord.Intents.default()
 intents.message_content = True
 
-class MyBot(commands.Bot):
+class MyBot(commands.AutoShardedBot):
+    metrics_runner = None
+
     async def setup_hook(self):
         # Load cogs
         for filename in os.listdir('./bot/cogs'):
             if filename.endswith('.py'):
                 await self.load_extension(f'bot.cogs.{filename[:-3]}')
         
-        # Sync slash commands
-        await self.tree.sync()
+        # Sync slash commands, only when they changed since the last successful sync
+        await self.sync_command_tree()
+
+        if config.METRICS_PORT:
+            try:
+                self.metrics_runner = await metrics.start_server(config.METRICS_HOST, config.METRICS_PORT)
+                print(f"Metrics served on http://{config.METRICS_HOST}:{config.METRICS_PORT}/metrics")
+            except OSError as e:
+                print(f"Failed to start metrics endpoint: {e}")
+
+    def command_tree_fingerprint(self) -> str:
+        payload = sorted((command.to_dict(self.tree) for command in self.tree.get_commands()), key=lambda c: c['name'])
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    async def sync_command_tree(self):
+        """
+        Global syncs are rate limited, so the tree's fingerprint is stored per application
+        and the sync is skipped when nothing changed. A failed sync is retried next boot.
+        """
+        fingerprint = self.command_tree_fingerprint()
+        key = f'command_tree:{self.application_id}'
+        store = StateStore(config.STATE_DB_FILE)
+        try:
+            if store.get_meta(key) == fingerprint:
+                print("Slash commands unchanged, skipping sync.")
+                return
+            try:
+                await self.tree.sync()
+            except discord.HTTPException as e:
+                print(f"Failed to sync slash commands: {e}")
+                return
+            store.set_meta(key, fingerprint)
+            print("Slash commands synced.")
+        finally:
+            store.close()
+
+    async def close(self):
+        await super().close()
+        if self.metrics_runner is not None:
+            await self.metrics_runner.cleanup()
+        # Cogs are unloaded by now, nothing uses the shared HTTP client anymore
+        await close_client()
 
-bot = MyBot(command_prefix='!', intents=intents)
+bot = MyBot(command_prefix='!', intents=intents, shard_count=config.SHARD_COUNT, shard_ids=config.SHARD_IDS)
 
 @bot.event
 async def on_ready():
-    print(f'Logged in as {bot.user}')
+    print(f'Logged in as {bot.user} (shards {bot.shard_ids or "all"} of {bot.shard_count})')
 
 async def main():
     async with bot:
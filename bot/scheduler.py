@@ -0,0 +1,92 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+from metrics import SCHEDULER_LAG_SECONDS
+from scrapers.models import parse_datetime
+
+def parse_timestamp(iso_date: Optional[str]) -> Optional[float]:
+    """
+    Parses an ISO date into a UTC timestamp, None if it is missing or invalid.
+    """
+    dt = parse_datetime(iso_date)
+    return dt.timestamp() if dt is not None else None
+
+class StartScheduler:
+    """
+    Fires a callback when tracked events start. Deadlines live in a min-heap so the
+    runner sleeps exactly until the earliest one; schedule/cancel wake it up early.
+    """
+    def __init__(self, callback: Callable[[List[Hashable]], Awaitable[None]]):
+        self.callback = callback
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._entries: Dict[Hashable, int] = {} # Structure: {key: seq of its live heap entry}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def schedule(self, key: Hashable, start_ts: float):
+        # Rescheduling leaves the old heap entry behind, it is skipped lazily
+        seq = next(self._counter)
+        self._entries[key] = seq
+        heapq.heappush(self._heap, (start_ts, seq, key))
+        self._wakeup.set()
+
+    def cancel(self, key: Hashable):
+        if self._entries.pop(key, None) is not None:
+            self._wakeup.set()
+
+    def next_deadline(self) -> Optional[float]:
+        self._drop_cancelled()
+        return self._heap[0][0] if self._heap else None
+
+    def start(self, wait_until: Callable[[], Awaitable[None]] = None):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run(wait_until))
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _drop_cancelled(self):
+        heap = self._heap
+        while heap and self._entries.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+
+    def _pop_due(self, now: float) -> List[Hashable]:
+        due = []
+        while True:
+            self._drop_cancelled()
+            if not self._heap or self._heap[0][0] > now:
+                return due
+            deadline, _, key = heapq.heappop(self._heap)
+            del self._entries[key]
+            SCHEDULER_LAG_SECONDS.observe(now - deadline)
+            due.append(key)
+
+    async def _run(self, wait_until):
+        if wait_until is not None:
+            await wait_until()
+
+        while True:
+            # Clear before inspecting the heap so a schedule() racing with us is not lost
+            self._wakeup.clear()
+            due = self._pop_due(time.time())
+            if due:
+                try:
+                    await self.callback(due)
+                except Exception as e:
+                    print(f"Start notification callback failed: {e}")
+                continue
+
+            deadline = self.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - time.time())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
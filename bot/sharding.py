@@ -0,0 +1,35 @@
+from typing import Optional, Tuple
+
+def shard_id_for(guild_id, shard_count: int) -> int:
+    # Discord's routing rule, a guild lives on the shard its ID hashes to
+    return (int(guild_id) >> 22) % shard_count
+
+def _own_shards(bot) -> Optional[Tuple[int, ...]]:
+    # None when this process runs every shard
+    shard_count: Optional[int] = bot.shard_count
+    if not shard_count or shard_count <= 1:
+        return None
+    shard_ids = getattr(bot, 'shard_ids', None)
+    if shard_ids is None:
+        shard_id = getattr(bot, 'shard_id', None)
+        if shard_id is None:
+            return None
+        shard_ids = (shard_id,)
+    return tuple(shard_ids)
+
+def owns_guild(bot, guild_id) -> bool:
+    """
+    True if this process runs the shard the guild belongs to. Per-guild background work
+    (notification fan-out, start checks) is only done by the owning process, so several
+    shard-group processes never send the same message twice.
+    """
+    shard_ids = _own_shards(bot)
+    return shard_ids is None or shard_id_for(guild_id, bot.shard_count) in shard_ids
+
+def shard_scope(bot) -> str:
+    """
+    Key of the shard group this process runs, e.g. "0,1", or "all" when it runs every shard.
+    State that each group keeps for its own guilds is stored under it.
+    """
+    shard_ids = _own_shards(bot)
+    return 'all' if shard_ids is None else ','.join(str(shard_id) for shard_id in sorted(shard_ids))
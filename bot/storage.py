@@ -0,0 +1,400 @@
+import sqlite3
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from metrics import STORE_WRITE_SECONDS
+from scrapers.models import Event
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS subscriptions (
+    guild_id TEXT PRIMARY KEY,
+    channel_id INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS guild_settings (
+    guild_id TEXT PRIMARY KEY,
+    ctftime_team_id TEXT
+);
+CREATE TABLE IF NOT EXISTS known_events (
+    scope TEXT NOT NULL DEFAULT 'all',
+    event_id TEXT NOT NULL,
+    url TEXT,
+    first_seen REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (scope, event_id)
+);
+CREATE INDEX IF NOT EXISTS idx_known_expiry ON known_events (expires_at);
+CREATE TABLE IF NOT EXISTS active_events (
+    guild_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    channel_id INTEGER NOT NULL,
+    url TEXT,
+    title TEXT,
+    start_date TEXT,
+    notified_start INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, event_id)
+);
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS catalog (
+    event_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS catalog_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL,
+    op TEXT NOT NULL,
+    published_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS failed_deliveries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id TEXT,
+    channel_id INTEGER,
+    event_id TEXT,
+    error TEXT,
+    failed_at REAL NOT NULL
+);
+"""
+
+# How long a write waits for another process's lock. The bot calls the store from its
+# event loop, so it only waits briefly; the ingest process can afford to wait longer.
+BUSY_TIMEOUT_MS = 100
+INGEST_BUSY_TIMEOUT_MS = 5000
+
+class StateStore:
+    """
+    SQLite backed bot state. Every write touches only the rows that changed,
+    so its cost no longer grows with the number of guilds.
+    """
+    def __init__(self, path: str, busy_timeout_ms: int = BUSY_TIMEOUT_MS):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # isolation_level=None: we open explicit transactions for batches
+        self.conn = sqlite3.connect(path, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL is still crash safe and avoids an fsync per commit
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # The ingest process writes to the same file, wait for its lock instead of failing.
+        # Its transactions are short, and WAL readers never wait on them.
+        self.conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _transaction(self, op: str = None):
+        # Write transactions name their operation so their duration is recorded
+        return _Transaction(self.conn, op)
+
+    # --- Meta ---
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def set_meta(self, key: str, value: str):
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    # --- Subscriptions ---
+    def load_subscriptions(self) -> Dict[str, int]:
+        rows = self.conn.execute("SELECT guild_id, channel_id FROM subscriptions")
+        return {row['guild_id']: row['channel_id'] for row in rows}
+
+    def set_subscription(self, guild_id: str, channel_id: int):
+        self.conn.execute(
+            "INSERT INTO subscriptions (guild_id, channel_id) VALUES (?, ?) "
+            "ON CONFLICT(guild_id) DO UPDATE SET channel_id = excluded.channel_id",
+            (str(guild_id), channel_id)
+        )
+
+    # --- Guild settings ---
+    def get_team_id(self, guild_id: str) -> Optional[str]:
+        row = self.conn.execute("SELECT ctftime_team_id FROM guild_settings WHERE guild_id = ?", (str(guild_id),)).fetchone()
+        return row['ctftime_team_id'] if row else None
+
+    def set_team_id(self, guild_id: str, team_id: str):
+        self.conn.execute(
+            "INSERT INTO guild_settings (guild_id, ctftime_team_id) VALUES (?, ?) "
+            "ON CONFLICT(guild_id) DO UPDATE SET ctftime_team_id = excluded.ctftime_team_id",
+            (str(guild_id), team_id)
+        )
+
+    # --- Known events ---
+    # Each shard group announces to its own guilds, so every group keeps its own set of
+    # announced events under a scope key (see bot.sharding.shard_scope)
+    def load_known_events(self, scope: str, default_expiry: float) -> Dict[str, float]:
+        """
+        Returns {event_id: expires_at} for the scope. Rows imported from the legacy JSON files have no expiry yet
+        and get default_expiry. A scope seen for the first time starts from what the other scopes know, so
+        changing the shard layout does not announce every listed event again.
+        """
+        with self._transaction('load_known_events'):
+            self.conn.execute("UPDATE known_events SET expires_at = ? WHERE expires_at IS NULL", (default_expiry,))
+            if not self.conn.execute("SELECT 1 FROM known_events WHERE scope = ? LIMIT 1", (scope,)).fetchone():
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO known_events (scope, event_id, url, first_seen, expires_at) "
+                    "SELECT ?, event_id, MIN(url), MIN(first_seen), MAX(expires_at) FROM known_events GROUP BY event_id",
+                    (scope,)
+                )
+        rows = self.conn.execute("SELECT event_id, expires_at FROM known_events WHERE scope = ?", (scope,))
+        return {row['event_id']: row['expires_at'] for row in rows}
+
+    def add_known_events(self, scope: str, events: Iterable[Tuple[str, str, float]]):
+        """
+        Batch insert of (event_id, url, expires_at) rows in a single transaction.
+        """
+        now = time.time()
+        with self._transaction('add_known_events'):
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO known_events (scope, event_id, url, first_seen, expires_at) VALUES (?, ?, ?, ?, ?)",
+                ((scope, event_id, url, now, expires_at) for event_id, url, expires_at in events)
+            )
+
+    def extend_known_events(self, scope: str, events: Iterable[Tuple[str, float]]):
+        """
+        Batch update of (event_id, expires_at) for events that are still listed.
+        """
+        with self._transaction('extend_known_events'):
+            self.conn.executemany(
+                "UPDATE known_events SET expires_at = ? WHERE scope = ? AND event_id = ? AND expires_at < ?",
+                ((expires_at, scope, event_id, expires_at) for event_id, expires_at in events)
+            )
+
+    def prune_known_events(self, now: float) -> int:
+        # Expiry follows the event, not the scope: this also clears scopes of retired shard layouts
+        cursor = self.conn.execute("DELETE FROM known_events WHERE expires_at < ?", (now,))
+        return cursor.rowcount
+
+    # --- Event data ---
+    def save_events(self, events: Iterable[Event]):
+        """
+        Upserts event payloads, posted messages refer to their event by key.
+        """
+        now = time.time()
+        with self._transaction('save_events'):
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO events (event_id, payload, updated_at) VALUES (?, ?, ?)",
+                ((event.id, json.dumps(event.to_dict()), now) for event in events if event.id)
+            )
+
+    def prune_events(self) -> int:
+        """
+        Deletes payloads nothing refers to anymore: no known, tracked or published event has
+        their key. Returns how many were removed.
+        """
+        with self._transaction('prune_events'):
+            cursor = self.conn.execute(
+                "DELETE FROM events WHERE event_id NOT IN (SELECT event_id FROM known_events) "
+                "AND event_id NOT IN (SELECT event_id FROM active_events) "
+                "AND event_id NOT IN (SELECT event_id FROM catalog)"
+            )
+        return cursor.rowcount
+
+    def get_event(self, event_id: str) -> Optional[Event]:
+        row = self.conn.execute("SELECT payload FROM events WHERE event_id = ?", (event_id,)).fetchone()
+        return Event.from_dict(json.loads(row['payload'])) if row else None
+
+    def get_events(self, event_ids: Iterable[str]) -> Dict[str, Event]:
+        event_ids = list(event_ids)
+        events = {}
+        # Chunked to stay under SQLite's bound parameter limit
+        for i in range(0, len(event_ids), 500):
+            chunk = event_ids[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT event_id, payload FROM events WHERE event_id IN ({','.join('?' * len(chunk))})", chunk
+            )
+            for row in rows:
+                events[row['event_id']] = Event.from_dict(json.loads(row['payload']))
+        return events
+
+    # --- Published catalog (ingest process) ---
+    def publish_catalog(self, upserts: Iterable[Event], removed: Iterable[str]) -> int:
+        """
+        Publishes one catalog diff in a single transaction: payloads of new or changed
+        events, catalog membership and one change log row per event. Returns the last seq.
+        """
+        now = time.time()
+        with self._transaction('publish_catalog'):
+            for event in upserts:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO events (event_id, payload, updated_at) VALUES (?, ?, ?)",
+                    (event.id, json.dumps(event.to_dict()), now)
+                )
+                seq = self.conn.execute(
+                    "INSERT INTO catalog_changes (event_id, op, published_at) VALUES (?, 'upsert', ?)", (event.id, now)
+                ).lastrowid
+                self.conn.execute("INSERT OR REPLACE INTO catalog (event_id, seq) VALUES (?, ?)", (event.id, seq))
+            for event_id in removed:
+                self.conn.execute(
+                    "INSERT INTO catalog_changes (event_id, op, published_at) VALUES (?, 'remove', ?)", (event_id, now)
+                )
+                self.conn.execute("DELETE FROM catalog WHERE event_id = ?", (event_id,))
+        return self.catalog_seq()
+
+    def catalog_seq(self) -> int:
+        # AUTOINCREMENT keeps counting after old rows are trimmed
+        row = self.conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'catalog_changes'").fetchone()
+        return row['seq'] if row else 0
+
+    def load_catalog(self) -> Tuple[int, List[Event]]:
+        """
+        Returns (seq, events) for the whole published catalog, read as one consistent snapshot.
+        """
+        with self._transaction():
+            seq = self.catalog_seq()
+            rows = self.conn.execute(
+                "SELECT e.payload FROM catalog c JOIN events e ON e.event_id = c.event_id"
+            ).fetchall()
+        return seq, [Event.from_dict(json.loads(row['payload'])) for row in rows]
+
+    def catalog_changes_since(self, seq: int) -> Optional[List[Tuple[int, str, str]]]:
+        """
+        Returns (seq, event_id, op) rows published after seq, or None if some of them
+        were already trimmed and the caller has to reload the catalog.
+        """
+        with self._transaction():
+            latest = self.catalog_seq()
+            if latest <= seq:
+                return []
+            rows = self.conn.execute(
+                "SELECT seq, event_id, op FROM catalog_changes WHERE seq > ? ORDER BY seq", (seq,)
+            ).fetchall()
+        if not rows or rows[0]['seq'] != seq + 1:
+            return None
+        return [(row['seq'], row['event_id'], row['op']) for row in rows]
+
+    def trim_catalog_changes(self, before: float) -> int:
+        cursor = self.conn.execute("DELETE FROM catalog_changes WHERE published_at < ?", (before,))
+        return cursor.rowcount
+
+    # --- Active events ---
+    def load_active_events(self) -> Dict[str, Dict[str, Dict]]:
+        active = {}
+        rows = self.conn.execute(
+            "SELECT guild_id, event_id, channel_id, url, title, start_date, notified_start FROM active_events"
+        )
+        for row in rows:
+            active.setdefault(row['guild_id'], {})[row['event_id']] = {
+                "channel_id": row['channel_id'],
+                "url": row['url'],
+                "title": row['title'],
+                "start_date": row['start_date'],
+                "notified_start": bool(row['notified_start'])
+            }
+        return active
+
+    def upsert_active_event(self, guild_id: str, event_id: str, info: Dict):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO active_events "
+            "(guild_id, event_id, channel_id, url, title, start_date, notified_start) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (str(guild_id), event_id, info['channel_id'], info.get('url'), info.get('title'),
+             info.get('start_date'), int(bool(info.get('notified_start'))))
+        )
+
+    def delete_active_event(self, guild_id: str, event_id: str):
+        self.conn.execute(
+            "DELETE FROM active_events WHERE guild_id = ? AND event_id = ?",
+            (str(guild_id), event_id)
+        )
+
+    def mark_started(self, keys: Iterable[Tuple[str, str]]):
+        """
+        Flags a batch of (guild_id, event_id) pairs as start-notified.
+        """
+        with self._transaction('mark_started'):
+            self.conn.executemany(
+                "UPDATE active_events SET notified_start = 1 WHERE guild_id = ? AND event_id = ?",
+                ((str(guild_id), event_id) for guild_id, event_id in keys)
+            )
+
+    # --- Delivery failures ---
+    def record_failed_deliveries(self, failures: Iterable[Tuple[str, int, str, str]]):
+        """
+        Batch insert of (guild_id, channel_id, event_id, error) rows.
+        """
+        now = time.time()
+        with self._transaction('record_failed_deliveries'):
+            self.conn.executemany(
+                "INSERT INTO failed_deliveries (guild_id, channel_id, event_id, error, failed_at) VALUES (?, ?, ?, ?, ?)",
+                ((str(guild_id), channel_id, event_id, error, now) for guild_id, channel_id, event_id, error in failures)
+            )
+
+    # --- Migration ---
+    def migrate_from_json(self, subscriptions_file: str, known_events_file: str, active_events_file: str, event_id_func):
+        """
+        One-time import of the legacy JSON state files. Imported files are renamed
+        to *.migrated so they are never read again.
+        """
+        if self.conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+            return
+
+        subscriptions = _read_json(subscriptions_file, {})
+        known_urls = _read_json(known_events_file, [])
+        active = _read_json(active_events_file, {})
+        now = time.time()
+
+        with self._transaction('migrate_from_json'):
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO subscriptions (guild_id, channel_id) VALUES (?, ?)",
+                ((str(guild_id), channel_id) for guild_id, channel_id in subscriptions.items())
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO known_events (event_id, url, first_seen) VALUES (?, ?, ?)",
+                ((event_id_func(url), url, now) for url in known_urls)
+            )
+            # Legacy active events were keyed by URL
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO active_events "
+                "(guild_id, event_id, channel_id, url, title, start_date, notified_start) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                ((str(guild_id), event_id_func(url), info.get('channel_id'), url, info.get('title'),
+                  info.get('start_date'), int(bool(info.get('notified_start'))))
+                 for guild_id, events_map in active.items()
+                 for url, info in events_map.items()
+                 if info.get('channel_id') is not None)
+            )
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (str(now),))
+
+        for filename in (subscriptions_file, known_events_file, active_events_file):
+            if os.path.exists(filename):
+                os.replace(filename, filename + ".migrated")
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection, op: str = None):
+        self.conn = conn
+        self.op = op
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        self.conn.execute("BEGIN")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+        if self.op is not None:
+            STORE_WRITE_SECONDS.observe(time.perf_counter() - self.started, op=self.op)
+        return False
+
+def _read_json(filename, default):
+    if os.path.exists(filename):
+        try:
+            with open(filename, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return default
+    return default
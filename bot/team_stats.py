@@ -0,0 +1,128 @@
+import asyncio
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+from scrapers.http_client import CircuitOpenError, HttpClient, get_client
+
+# Team pages are served by CTFtime, they share its circuit breaker with the scraper
+SOURCE = 'CTFtime'
+
+# Team results only change when a CTF is rated
+DEFAULT_TTL = 30 * 60
+
+# The results table's class. Matched with a regex because the strainer sees the raw,
+# space separated class attribute.
+RESULTS_TABLE_CLASS = re.compile(r'\btable-striped\b')
+
+class TeamStatsError(Exception):
+    pass
+
+def team_url(team_id: str) -> str:
+    return f'https://ctftime.org/team/{team_id}'
+
+def parse_team_results(html: str) -> Optional[List[Dict]]:
+    """
+    Extracts the team's results, sorted by rating points descending.
+    Returns None if the page has no results table. CPU bound, run it in a thread.
+    """
+    # BeautifulSoup is only imported once a team page is actually parsed
+    from bs4 import BeautifulSoup, SoupStrainer
+    try:
+        import lxml  # noqa: F401
+        parser = 'lxml'
+    except ImportError:
+        parser = 'html.parser'
+
+    # Only the results table is turned into a tree, the rest of the page is skipped
+    soup = BeautifulSoup(html, parser, parse_only=SoupStrainer('table', class_=RESULTS_TABLE_CLASS))
+    table = soup.find('table')
+    if not table:
+        return None
+
+    data = []
+    rows = table.find_all('tr')
+
+    # Skip header row
+    for row in rows[1:]:
+        cols = row.find_all('td')
+        if len(cols) >= 5: # Ensure enough columns
+            try:
+                place = cols[1].text.strip()
+                event_name = cols[2].text.strip()
+
+                # cols[3] is "CTF points", cols[4] is "Rating points" (may carry a trailing "*")
+                rating_str = cols[4].text.strip().replace("*", "")
+                if not rating_str:
+                    rating_points = 0.0
+                else:
+                    rating_points = float(rating_str)
+
+                data.append({
+                    'place': place,
+                    'event_name': event_name,
+                    'rating_points': rating_points
+                })
+            except ValueError:
+                continue # Skip rows with bad data
+
+    # Sort by rating points descending
+    data.sort(key=lambda x: x['rating_points'], reverse=True)
+    return data
+
+class TeamStatsService:
+    """
+    Fetches and caches CTFtime team results per team ID over the shared HTTP client.
+    """
+    def __init__(self, ttl: float = DEFAULT_TTL, client: HttpClient = None):
+        self.ttl = ttl
+        self.client = client or get_client()
+        self._cache: Dict[str, Tuple[float, List[Dict]]] = {} # Structure: {team_id: (fetched_at, results)}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def close(self):
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+
+    async def get_results(self, team_id: str) -> List[Dict]:
+        """
+        Returns the team's results sorted by rating points, raises TeamStatsError on failure.
+        While CTFtime is failing, expired results are served rather than an error.
+        """
+        team_id = str(team_id)
+        cached = self._cache.get(team_id)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+        if cached and not self.client.is_available(SOURCE):
+            return cached[1]
+
+        # Concurrent commands for the same team share one fetch
+        task = self._inflight.get(team_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(team_id))
+            self._inflight[team_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(team_id, None))
+        try:
+            return await asyncio.shield(task)
+        except Exception as e:
+            if cached:
+                return cached[1]
+            if isinstance(e, TeamStatsError):
+                raise
+            if isinstance(e, CircuitOpenError):
+                raise TeamStatsError("CTFtime is not responding, try again in a minute.") from e
+            raise TeamStatsError(f"Failed to fetch data from CTFtime ({e})") from e
+
+    async def _fetch(self, team_id: str) -> List[Dict]:
+        response = await self.client.get(team_url(team_id), source=SOURCE)
+        if response.status != 200:
+            raise TeamStatsError(f"Failed to fetch data from CTFtime (Status: {response.status})")
+        html = response.text()
+
+        # Parsing is kept off the event loop
+        results = await asyncio.to_thread(parse_team_results, html)
+        if results is None:
+            raise TeamStatsError("Could not find events table on CTFtime page.")
+
+        self._cache[team_id] = (time.monotonic(), results)
+        return results
@@ -1,30 +1,73 @@
 import discord
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from scrapers.models import Event
 
-def format_date(iso_date: str) -> str:
-    try:
-        # Simple ISO parsing (assumes "2026-01-09T00:00:00+00:00" format)
-        # We can use strptime or fromisoformat in Python 3.7+
-        dt = datetime.fromisoformat(iso_date)
-        return dt.strftime("%a, %d %b. %Y, %H:%M UTC")
-    except Exception:
-        return iso_date
+# Discord message limits: 10 embeds and 6000 embed characters in total
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
 
-def create_event_embed(event: Dict) -> discord.Embed:
+# Rendered event embeds kept around, enough for every event in the catalog
+EMBED_CACHE_SIZE = 2048
+_embed_cache: 'OrderedDict[str, Tuple[Tuple, Dict]]' = OrderedDict() # Structure: {event_id: (fingerprint, payload)}
+
+def format_date(dt: Optional[datetime]) -> str:
+    # Dates arrive already parsed (timezone aware) from the scraper pipeline
+    if dt is None:
+        return ''
+    return dt.strftime("%a, %d %b. %Y, %H:%M UTC")
+
+def _embed_fingerprint(event: Event) -> Tuple:
+    # Everything the embed shows, a change to any of these re-renders it
+    return (
+        event.title, event.description, event.start, event.end, event.onsite, event.type,
+        event.url, event.ctftime_url, event.weight, event.organizers, event.sources, event.logo_url,
+    )
+
+def _embed_from_payload(payload: Dict) -> discord.Embed:
+    # from_dict keeps references, copy the nested parts so callers can't alter the cache
+    data = dict(payload)
+    for key in ('footer', 'thumbnail'):
+        if key in data:
+            data[key] = dict(data[key])
+    if 'fields' in data:
+        data['fields'] = [dict(field) for field in data['fields']]
+    return discord.Embed.from_dict(data)
+
+def create_event_embed(event: Event) -> discord.Embed:
+    """
+    Returns the detailed embed for an event. Renders are cached per event ID and only
+    redone when the event's displayed content changes, so a notification fan-out renders
+    each event once.
+    """
+    fingerprint = _embed_fingerprint(event)
+    cached = _embed_cache.get(event.id) if event.id else None
+    if cached is not None and cached[0] == fingerprint:
+        _embed_cache.move_to_end(event.id)
+        return _embed_from_payload(cached[1])
+
+    embed = render_event_embed(event)
+    if event.id:
+        _embed_cache[event.id] = (fingerprint, embed.to_dict())
+        _embed_cache.move_to_end(event.id)
+        if len(_embed_cache) > EMBED_CACHE_SIZE:
+            _embed_cache.popitem(last=False)
+    return embed
+
+def render_event_embed(event: Event) -> discord.Embed:
     """
     Creates a detailed Discord Embed for a single event matching user request.
     """
-    title = event.get('title', 'Unknown Event')
-    url = event.get('url', '')
-    description = event.get('description', 'No description.')
+    title = event.title or 'Unknown Event'
+    description = event.description or 'No description.'
     
     # Truncate description for embed limits if necessary, better to keep it reasonable
     if len(description) > 300:
         description = description[:297] + "..."
 
-    start_str = format_date(event.get('start_date', ''))
-    end_str = format_date(event.get('end_date', ''))
+    start_str = format_date(event.start)
+    end_str = format_date(event.end)
     date_range = f"{start_str} — {end_str}"
     
     embed = discord.Embed(
@@ -37,37 +80,35 @@ def create_event_embed(event: Dict) -> discord.Embed:
     embed.add_field(name="Date", value=date_range, inline=False)
     
     # Type / Location
-    onsite = event.get('onsite', False)
-    location = "On-line" if not onsite else "On-site"
+    location = "On-line" if not event.onsite else "On-site"
     embed.add_field(name="Location", value=location, inline=True)
     
     # Format
-    fmt = event.get('type', 'Jeopardy')
+    fmt = event.type or 'Jeopardy'
     embed.add_field(name="Format", value=fmt, inline=True)
     
     # Links
-    website = event.get('url', 'N/A')
-    ctftime_link = event.get('ctftime_url', 'N/A')
+    website = event.url or 'N/A'
+    ctftime_link = event.ctftime_url or 'N/A'
     embed.add_field(name="Official URL", value=website, inline=False)
     embed.add_field(name="CTFtime URL", value=ctftime_link, inline=False)
     
     # Weight
-    weight = event.get('weight', 0)
-    embed.add_field(name="Rating Weight", value=str(weight), inline=True)
+    embed.add_field(name="Rating Weight", value=str(event.weight), inline=True)
     
     # Organizers
-    if event.get('organizers'):
-        orgs = "\n".join(event['organizers'])
+    if event.organizers:
+        orgs = "\n".join(event.organizers)
         embed.add_field(name="Event Organizers", value=orgs, inline=False)
         
-    embed.set_footer(text=f"Source: {event.get('source', 'Unknown')}")
+    embed.set_footer(text=f"Source: {', '.join(str(s) for s in event.sources)}")
     
-    if event.get('logo_url'):
-        embed.set_thumbnail(url=event['logo_url'])
+    if event.logo_url:
+        embed.set_thumbnail(url=event.logo_url)
         
     return embed
 
-def create_events_summary_embed(events: List[Dict]) -> discord.Embed:
+def create_events_summary_embed(events: List[Event]) -> discord.Embed:
     """
     Creates a summary list embed.
     """
@@ -78,10 +119,10 @@ def create_events_summary_embed(events: List[Dict]) -> discord.Embed:
     )
     
     for event in events[:10]: # Limit to 10 to avoid hitting limits
-        start_display = event.get('start_date', '').split('T')[0]
+        start_display = event.start.date().isoformat() if event.start else ''
         embed.add_field(
-            name=f"{event['title']} ({start_display})",
-            value=f"[Link]({event['url']}) - {event.get('type', 'Event')}",
+            name=f"{event.title} ({start_display})",
+            value=f"[Link]({event.url}) - {event.type or 'Event'}",
             inline=False
         )
         
@@ -89,3 +130,22 @@ def create_events_summary_embed(events: List[Dict]) -> discord.Embed:
         embed.set_footer(text=f"And {len(events) - 10} more events...")
         
     return embed
+
+def pack_embeds(embeds: List[discord.Embed]) -> List[Tuple[int, int]]:
+    """
+    Greedily groups consecutive embeds into messages that stay within Discord's limits.
+    Returns (start, end) slices into the list.
+    """
+    groups = []
+    start = 0
+    chars = 0
+    for i, embed in enumerate(embeds):
+        size = len(embed)
+        if i > start and (i - start >= MAX_EMBEDS_PER_MESSAGE or chars + size > MAX_EMBED_CHARS_PER_MESSAGE):
+            groups.append((start, i))
+            start = i
+            chars = 0
+        chars += size
+    if start < len(embeds):
+        groups.append((start, len(embeds)))
+    return groups
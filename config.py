@@ -5,3 +5,17 @@ load_dotenv()
 
 TOKEN = os.getenv('DISCORD_TOKEN')
 CTFTIME_TEAM_ID = os.getenv('CTFTIME_TEAM_ID', '370140')
+STATE_DB_FILE = os.getenv('STATE_DB_FILE', 'data/eventbot.db')
+CATALOG_SNAPSHOT_FILE = os.getenv('CATALOG_SNAPSHOT_FILE', 'data/catalog.snapshot')
+# 'inline' scrapes inside the bot process, 'external' leaves it to bot/ingest.py
+INGEST_MODE = os.getenv('INGEST_MODE', 'inline')
+INGEST_INTERVAL = int(os.getenv('INGEST_INTERVAL', '900'))
+# Unset: Discord picks the shard count and this process runs all shards.
+# For shard-group processes set the same SHARD_COUNT everywhere and SHARD_IDS=0,1,... per process.
+SHARD_COUNT = int(os.getenv('SHARD_COUNT')) if os.getenv('SHARD_COUNT') else None
+SHARD_IDS = [int(i) for i in os.getenv('SHARD_IDS').split(',')] if os.getenv('SHARD_IDS') else None
+# Local Prometheus endpoint at http://METRICS_HOST:METRICS_PORT/metrics, off unless a port is set
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+METRICS_PORT = int(os.getenv('METRICS_PORT')) if os.getenv('METRICS_PORT') else None
+# Same for the external ingest process, it needs its own port
+INGEST_METRICS_PORT = int(os.getenv('INGEST_METRICS_PORT')) if os.getenv('INGEST_METRICS_PORT') else None
@@ -0,0 +1,203 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+# Seconds, spans sub-millisecond store writes up to slow upstream fetches
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict) -> _LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _format_labels(key: _LabelKey, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: Dict[_LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def total(self) -> float:
+        return sum(self._values.values())
+
+    def items(self) -> List[Tuple[Dict[str, str], float]]:
+        return [(dict(key), value) for key, value in sorted(self._values.items())]
+
+    def render(self) -> List[str]:
+        return [f'{self.name}{_format_labels(key)} {value}' for key, value in sorted(self._values.items())]
+
+class _Series:
+    __slots__ = ('buckets', 'count', 'sum', 'max')
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+class _Timer:
+    __slots__ = ('histogram', 'labels', 'started')
+
+    def __init__(self, histogram: 'Histogram', labels: Dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+        return False
+
+class Histogram:
+    """
+    Cumulative buckets plus count, sum and max per label set, cheap enough for hot paths.
+    """
+    kind = 'histogram'
+
+    def __init__(self, name: str, help: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.bounds = tuple(buckets)
+        self._series: Dict[_LabelKey, _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.bounds) + 1)
+            series.buckets[bisect_left(self.bounds, value)] += 1
+            series.count += 1
+            series.sum += value
+            if value > series.max:
+                series.max = value
+
+    def time(self, **labels) -> _Timer:
+        """
+        Context manager observing the duration of its block.
+        """
+        return _Timer(self, labels)
+
+    def series(self, **labels) -> Optional[_Series]:
+        return self._series.get(_label_key(labels))
+
+    def label_sets(self) -> List[Dict[str, str]]:
+        return [dict(key) for key in sorted(self._series)]
+
+    def quantile(self, q: float, **labels) -> Optional[float]:
+        """
+        Upper bound of the bucket holding the q-quantile, None without observations.
+        """
+        series = self.series(**labels)
+        if series is None or not series.count:
+            return None
+        rank = q * series.count
+        seen = 0
+        for bound, count in zip(self.bounds, series.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return series.max
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.bounds, series.buckets):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{_format_labels(key, (("le", repr(bound)),))} {cumulative}')
+            lines.append(f'{self.name}_bucket{_format_labels(key, (("le", "+Inf"),))} {series.count}')
+            lines.append(f'{self.name}_sum{_format_labels(key)} {series.sum}')
+            lines.append(f'{self.name}_count{_format_labels(key)} {series.count}')
+        return lines
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def _get(self, cls, name: str, help: str, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help, **kwargs)
+        return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._get(Counter, name, help)
+
+    def histogram(self, name: str, help: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help, buckets=buckets)
+
+    def render(self) -> str:
+        """
+        All metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f'# HELP {name} {metric.help}')
+            lines.append(f'# TYPE {name} {metric.kind}')
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = Registry()
+counter = REGISTRY.counter
+histogram = REGISTRY.histogram
+
+# --- Hot path metrics, shared by the scrapers and the bot ---
+SCRAPE_SECONDS = histogram('eventbot_scrape_seconds', 'Time to fetch one source, by source and outcome.')
+NORMALIZE_SECONDS = histogram('eventbot_normalize_seconds', 'Time to normalize one page of raw records, by source.')
+POLLS = counter('eventbot_polls_total', 'Upstream polls, by source and outcome (changed, unchanged, error).')
+CACHE_REQUESTS = counter('eventbot_cache_requests_total', 'Per-source cache lookups, by result (hit, stale, miss) and caller (query, poll).')
+SEND_SECONDS = histogram('eventbot_send_seconds', 'Discord message send latency.')
+DELIVERIES = counter('eventbot_deliveries_total', 'Notification deliveries, by result.')
+RATE_LIMIT_WAIT_SECONDS = histogram('eventbot_rate_limit_wait_seconds', 'Time spent waiting for a rate limit token, by bucket.')
+SCHEDULER_LAG_SECONDS = histogram('eventbot_scheduler_lag_seconds', 'Delay between an event start and its start check running.')
+STORE_WRITE_SECONDS = histogram('eventbot_store_write_seconds', 'State store write transaction time, by operation.')
+CHECK_SECONDS = histogram('eventbot_check_new_events_seconds', 'Duration of one check_new_events run.')
+
+def cache_hit_ratio(caller: str = 'query') -> Optional[float]:
+    """
+    Share of one caller's cache lookups answered without waiting on upstream (fresh or stale hits).
+    """
+    lookups = [(labels, value) for labels, value in CACHE_REQUESTS.items() if labels.get('caller') == caller]
+    total = sum(value for _, value in lookups)
+    if not total:
+        return None
+    return sum(value for labels, value in lookups if labels.get('result') != 'miss') / total
+
+async def start_server(host: str, port: int):
+    """
+    Serves REGISTRY at http://host:port/metrics. Returns the runner, clean it up to stop.
+    """
+    from aiohttp import web
+
+    async def handle(request):
+        return web.Response(text=REGISTRY.render(), content_type='text/plain', charset='utf-8',
+                            headers={'X-Content-Type-Options': 'nosniff'})
+
+    app = web.Application()
+    app.router.add_get('/metrics', handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
@@ -1,20 +1,139 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import AsyncIterator, List, Dict, Tuple
+import hashlib
+import json
+import time
+from metrics import NORMALIZE_SECONDS
+from .http_client import HttpClient
+from .models import Event
+
+# Incremental polls only walk new pages, this often everything is crawled again
+FULL_SYNC_INTERVAL = 24 * 60 * 60
 
 class BaseScraper(ABC):
+    # Human readable source name, also used as the cache / log key
+    name = "Unknown"
+    # Seconds the manager waits for this source before giving up on it
+    timeout = 15
+    # True if the listing is ordered newest first, so paging can stop at known events
+    incremental = False
+    # Bounds for the adaptive polling interval, in seconds
+    min_poll_interval = 5 * 60
+    max_poll_interval = 2 * 60 * 60
+
+    def __init__(self):
+        self._validators: Dict[str, Dict] = {} # Structure: {endpoint: {etag, last_modified, body_hash}}
+        self._last_events: List[Event] = []
+        self._pages: Dict[str, List[Event]] = {} # Structure: {page key: normalized events}
+        self._last_full_sync = 0.0
+        # False when the last fetch_events returned the previous result unchanged
+        self.changed = True
+
     @abstractmethod
-    def fetch_events(self) -> List[Dict]:
-        """
-        Fetches events and returns a list of dictionaries.
-        Each dictionary should have at least:
-        - title
-        - description
-        - start_date (ISO format)
-        - end_date (ISO format)
-        - url
-        - type (Jeopardy, Attack-Defense, Hackathon, etc.)
-        - prize (optional)
-        - organizers (optional)
-        - logo_url (optional)
+    def iter_pages(self, client: HttpClient) -> AsyncIterator[Tuple[List[Event], bool]]:
+        """
+        Async generator over the source's listing, yielding (normalized events, changed)
+        one page at a time. Unchanged pages are served from _recall_page.
+        Raw records are normalized into Event objects, with dates parsed once here.
+        Fetch errors propagate, so the manager keeps serving the last good result.
         """
         pass
+
+    async def fetch_events(self, client: HttpClient) -> List[Event]:
+        """
+        Pages through the listing lazily. For incremental (newest first) sources the walk
+        stops at the first page that is unchanged or only holds already known events, and
+        the rest is carried over from the previous result. A full crawl runs every
+        FULL_SYNC_INTERVAL seconds.
+        """
+        now = time.time()
+        full_sync = now - self._last_full_sync >= FULL_SYNC_INTERVAL
+        if full_sync:
+            # Forget the validators so every page is downloaded again
+            self._validators.clear()
+            self._pages.clear()
+        known = {e.url for e in self._last_events}
+
+        events = []
+        fetched = set()
+        changed = False
+        truncated = False
+        async for page, page_changed in self.iter_pages(client):
+            changed = changed or page_changed
+            for event in page:
+                if event.url not in fetched:
+                    fetched.add(event.url)
+                    events.append(event)
+            if self.incremental and not full_sync and (not page_changed or all(e.url in known for e in page)):
+                truncated = True
+                break
+
+        if full_sync:
+            self._last_full_sync = now
+        if not changed:
+            return self._unchanged()
+
+        if truncated:
+            # Keep what the pages we did not re-download held last time, minus finished events
+            events.extend(
+                e for e in self._last_events
+                if e.url not in fetched and not (e.end_ts is not None and e.end_ts < now)
+            )
+        return self._updated(events)
+
+    async def _fetch_json(self, client: HttpClient, url: str, params: Dict = None, key: str = None):
+        """
+        Conditional GET. Sends the stored ETag / Last-Modified validators for the endpoint
+        and returns None when the upstream answers 304 or sends back the same bytes,
+        otherwise the decoded JSON body.
+        """
+        key = key or url
+        validators = self._validators.get(key, {})
+
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        response = await client.get(url, source=self.name, params=params, headers=headers)
+        if response.status == 304:
+            return None
+        response.raise_for_status()
+        body = response.body
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        body_hash = hashlib.blake2b(body, digest_size=16).digest()
+        unchanged = body_hash == validators.get('body_hash')
+        # Decode before storing the validators so a bad body is never marked as seen
+        data = None if unchanged else json.loads(body)
+        self._validators[key] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'body_hash': body_hash,
+        }
+        return data
+
+    def normalize(self, raw) -> List[Event]:
+        """
+        Runs the scraper's _normalize on one page of raw records, timed per source.
+        """
+        with NORMALIZE_SECONDS.time(source=self.name):
+            return self._normalize(raw)
+
+    def _remember_page(self, key: str, events: List[Event]) -> Tuple[List[Event], bool]:
+        self._pages[key] = events
+        return events, True
+
+    def _recall_page(self, key: str) -> Tuple[List[Event], bool]:
+        return self._pages.get(key, []), False
+
+    def _unchanged(self) -> List[Event]:
+        self.changed = False
+        return self._last_events
+
+    def _updated(self, events: List[Event]) -> List[Event]:
+        self.changed = True
+        self._last_events = events
+        return events
@@ -0,0 +1,177 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from .models import Event, Source, NO_START
+
+# Index entries sort by start time, the ID breaks ties
+_Entry = Tuple[float, str]
+
+# Fields compared when looking for updated events
+DIFF_FIELDS = (
+    'title', 'url', 'start', 'end', 'description', 'ctftime_url', 'type', 'logo_url',
+    'organizers', 'weight', 'onsite', 'sources', 'alt_urls',
+)
+
+def _index_key(event: Event) -> Tuple[float, Source, Optional[str]]:
+    return event.sort_key, event.source, event.type
+
+def _content_hash(event: Event) -> int:
+    return hash(tuple(getattr(event, name) for name in DIFF_FIELDS))
+
+def _as_ts(value) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+def filter_args(type_filter: Optional[str]) -> Dict:
+    """
+    Maps the commands' type filter onto EventCatalog.query arguments.
+    """
+    if type_filter == 'CTF':
+        return {'source': Source.CTFTIME}
+    if type_filter == 'Hackathon':
+        return {'type': 'Hackathon'}
+    return {}
+
+class CatalogChanges:
+    """
+    Net changes between two points in time. updated holds (old, new, changed field names).
+    """
+    __slots__ = ('added', 'updated', 'removed')
+
+    def __init__(self):
+        self.added: List[Event] = []
+        self.updated: List[Tuple[Event, Event, Tuple[str, ...]]] = []
+        self.removed: List[Event] = []
+
+    def __bool__(self):
+        return bool(self.added or self.updated or self.removed)
+
+class EventCatalog:
+    """
+    In-memory event catalog with per-source and per-type indexes kept sorted by start
+    time. Updates only touch the entries that changed, and range queries are answered
+    with bisect instead of a full scan and sort.
+    """
+    def __init__(self):
+        self._events: Dict[str, Event] = {}
+        self._all: List[_Entry] = []
+        self._by_source: Dict[Source, List[_Entry]] = {}
+        self._by_type: Dict[str, List[_Entry]] = {}
+        self._hashes: Dict[str, int] = {}
+        # First version of every event touched since the last drain_changes, None if it was new
+        self._touched: Dict[str, Optional[Event]] = {}
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._events
+
+    def get(self, event_id: str) -> Optional[Event]:
+        return self._events.get(event_id)
+
+    def _indexes(self, event: Event) -> List[List[_Entry]]:
+        indexes = [self._all, self._by_source.setdefault(event.source, [])]
+        if event.type:
+            indexes.append(self._by_type.setdefault(event.type, []))
+        return indexes
+
+    def _insert(self, event: Event):
+        entry = (event.sort_key, event.id)
+        for index in self._indexes(event):
+            insort(index, entry)
+
+    def _remove(self, event: Event):
+        entry = (event.sort_key, event.id)
+        for index in self._indexes(event):
+            i = bisect_left(index, entry)
+            if i < len(index) and index[i] == entry:
+                del index[i]
+
+    def update(self, events: Iterable[Event]) -> Tuple[int, int, int]:
+        """
+        Replaces the catalog contents with a new snapshot. Returns (added, moved, removed)
+        counts; events whose start, source and type are unchanged keep their index entries.
+        What changed is also recorded for drain_changes.
+        """
+        incoming = {event.id: event for event in events if event.id}
+        added = moved = removed = 0
+
+        for event_id in [event_id for event_id in self._events if event_id not in incoming]:
+            old = self._events.pop(event_id)
+            self._remove(old)
+            del self._hashes[event_id]
+            self._touched.setdefault(event_id, old)
+            removed += 1
+
+        for event_id, event in incoming.items():
+            old = self._events.get(event_id)
+            content_hash = _content_hash(event)
+            if old is None:
+                self._insert(event)
+                self._touched.setdefault(event_id, None)
+                added += 1
+            else:
+                if _index_key(old) != _index_key(event):
+                    self._remove(old)
+                    self._insert(event)
+                    moved += 1
+                if self._hashes[event_id] != content_hash:
+                    self._touched.setdefault(event_id, old)
+            self._events[event_id] = event
+            self._hashes[event_id] = content_hash
+
+        return added, moved, removed
+
+    def drain_changes(self) -> CatalogChanges:
+        """
+        Returns what was added, updated (with the changed fields) or removed since the
+        previous call. Only events whose content hash changed are compared field by field.
+        """
+        changes = CatalogChanges()
+        for event_id, old in self._touched.items():
+            new = self._events.get(event_id)
+            if old is None:
+                if new is not None:
+                    changes.added.append(new)
+            elif new is None:
+                changes.removed.append(old)
+            else:
+                fields = tuple(name for name in DIFF_FIELDS if getattr(old, name) != getattr(new, name))
+                if fields:
+                    changes.updated.append((old, new, fields))
+        self._touched.clear()
+        return changes
+
+    def query(self, source: Source = None, type: str = None, start=None, end=None, limit: int = None) -> List[Event]:
+        """
+        Events ordered by start time, optionally restricted to one source or type and to
+        a start time window [start, end). start/end take datetimes or timestamps.
+        Events without a start date are only returned when no window is given.
+        """
+        if source is not None:
+            index = self._by_source.get(source, [])
+        elif type is not None:
+            index = self._by_type.get(type, [])
+        else:
+            index = self._all
+
+        start_ts = _as_ts(start)
+        end_ts = _as_ts(end)
+        lo = bisect_left(index, (start_ts, '')) if start_ts is not None else 0
+        if end_ts is not None:
+            hi = bisect_left(index, (end_ts, ''))
+        elif start_ts is not None:
+            hi = bisect_left(index, (NO_START, ''))
+        else:
+            hi = len(index)
+        if source is not None and type is not None:
+            # Both constraints, walk the source index and check the type
+            events = [self._events[event_id] for _, event_id in index[lo:hi]]
+            return [event for event in events if event.type == type][:limit]
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return [self._events[event_id] for _, event_id in index[lo:hi]]
@@ -1,39 +1,53 @@
-import requests
-from datetime import datetime
 import time
 from .base import BaseScraper
+from .http_client import HttpClient
+from .models import Event, Source, parse_datetime
 from typing import List, Dict
 
 class CTFTimeScraper(BaseScraper):
+    name = "CTFtime"
+    timeout = 30
+
     def __init__(self):
+        super().__init__()
         self.api_url = "https://ctftime.org/api/v1/events/"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
 
-    def fetch_events(self, limit: int = 10, days: int = 30) -> List[Dict]:
+    async def iter_pages(self, client: HttpClient, page_size: int = 50, days: int = 90, max_pages: int = 10):
         """
-        Fetch upcoming CTF events from CTFtime.
+        Fetch upcoming CTF events from CTFtime. The API has no offset parameter, so pages
+        are walked by moving the start of the window to the last start time seen.
         """
-        start_timestamp = int(time.time())
+        # Round down to the hour so successive polls send identical requests
+        # and the conditional GET can actually match
+        start_timestamp = int(time.time()) // 3600 * 3600
         end_timestamp = start_timestamp + (days * 24 * 60 * 60)
-        
-        params = {
-            'limit': limit,
-            'start': start_timestamp,
-            'finish': end_timestamp,
-        }
-
-        try:
-            response = requests.get(self.api_url, params=params, headers=self.headers)
-            response.raise_for_status()
-            events = response.json()
-            return self._normalize(events)
-        except Exception as e:
-            print(f"Error fetching CTFtime events: {e}")
-            return []
-
-    def _normalize(self, events: List[Dict]) -> List[Dict]:
+        cursor = start_timestamp
+
+        for page in range(max_pages):
+            params = {
+                'limit': page_size,
+                'start': cursor,
+                'finish': end_timestamp,
+            }
+            key = f"{self.api_url}#{page}"
+
+            raw = await self._fetch_json(client, self.api_url, params=params, key=key)
+            if raw is None:
+                events, changed = self._recall_page(key)
+            else:
+                events, changed = self._remember_page(key, self.normalize(raw))
+
+            yield events, changed
+
+            if len(events) < page_size:
+                return
+            last_start = int(max((e.start_ts or 0 for e in events), default=cursor))
+            if last_start <= cursor:
+                # A full page sharing one start time, moving on would loop forever
+                return
+            cursor = last_start
+
+    def _normalize(self, events: List[Dict]) -> List[Event]:
         normalized_events = []
         for event in events:
             # Check if public
@@ -43,18 +57,18 @@ class CTFTimeScraper(BaseScraper):
             # Extract prize info if available (CTFtime api doesn't give prize pool directly in list, 
             # might need to parse description or just leave generic)
             
-            normalized_events.append({
-                'source': 'CTFtime',
-                'title': event.get('title'),
-                'description': event.get('description', 'No description provided.'),
-                'start_date': event.get('start'),
-                'end_date': event.get('finish'),
-                'url': event.get('url'),
-                'ctftime_url': event.get('ctftime_url'),
-                'type': event.get('format'),
-                'logo_url': event.get('logo'),
-                'organizers': [org['name'] for org in event.get('organizers', [])],
-                'weight': event.get('weight'),
-                'is_open': True # details can vary
-            })
+            normalized_events.append(Event(
+                source=Source.CTFTIME,
+                title=event.get('title'),
+                description=event.get('description') or 'No description provided.',
+                start=parse_datetime(event.get('start')),
+                end=parse_datetime(event.get('finish')),
+                url=event.get('url'),
+                ctftime_url=event.get('ctftime_url'),
+                type=event.get('format'),
+                logo_url=event.get('logo'),
+                organizers=tuple(org['name'] for org in event.get('organizers', [])),
+                weight=event.get('weight') or 0.0,
+                onsite=bool(event.get('onsite')),
+            ))
         return normalized_events
@@ -0,0 +1,100 @@
+import dataclasses
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+from .models import Event, NO_START
+
+# Words that carry no identity, "FooCTF 2026" and "Foo CTF" are the same event
+FILLER_WORDS = {'the', 'ctf', 'hackathon', 'edition', 'online', 'qualifier', 'quals'}
+YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+def normalize_title(title: Optional[str]) -> str:
+    if not title:
+        return ''
+    text = unicodedata.normalize('NFKD', title).encode('ascii', 'ignore').decode('ascii').lower()
+    text = YEAR_RE.sub(' ', text)
+    # Split glued suffixes like "fooctf" so they normalize like "foo ctf"
+    text = re.sub(r'(ctf|hackathon)\b', r' \1', text)
+    words = [w for w in NON_ALNUM_RE.split(text) if w and w not in FILLER_WORDS]
+    return ' '.join(words)
+
+def normalize_url(url: Optional[str]) -> str:
+    if not url:
+        return ''
+    url = url.strip().lower()
+    url = re.sub(r'^https?://', '', url)
+    if url.startswith('www.'):
+        url = url[4:]
+    return url.rstrip('/')
+
+def organizer_fingerprint(event: Event) -> frozenset:
+    return frozenset(normalize_title(org) for org in event.organizers if org and org != 'Unknown')
+
+# Fields a duplicate may fill in when the primary record lacks them
+FILLABLE_FIELDS = ('start', 'end', 'description', 'ctftime_url', 'type', 'logo_url')
+
+def _merge_into(primary: Event, other: Event):
+    """
+    Fills the primary record's gaps from a duplicate and records where it was also seen.
+    """
+    for name in FILLABLE_FIELDS:
+        if getattr(primary, name) in (None, '') and getattr(other, name) not in (None, ''):
+            setattr(primary, name, getattr(other, name))
+    primary.sort_key = primary.start.timestamp() if primary.start else NO_START
+
+    extra_orgs = tuple(org for org in other.organizers if org not in primary.organizers and org != 'Unknown')
+    if extra_orgs:
+        primary.organizers = primary.organizers + extra_orgs
+
+    if other.source not in primary.sources:
+        primary.sources = primary.sources + (other.source,)
+    if other.url and other.url != primary.url and other.url not in primary.alt_urls:
+        primary.alt_urls = primary.alt_urls + (other.url,)
+
+def merge_events(events: List[Event]) -> List[Event]:
+    """
+    Collapses the same event reported by several sources (or under several URLs) into one
+    record with a stable canonical id. Input order is priority order: the first record
+    seen for an event is the primary, its URL determines the ID and its fields win.
+
+    Matching uses hash indexes instead of pairwise comparison, so it runs in linear time:
+    - same normalized URL, or
+    - same normalized title with a start date at most one day apart, unless both sides
+      list organizers and they have nothing in common.
+    """
+    merged: List[Event] = []
+    by_url: Dict[str, int] = {}
+    by_title: Dict[Tuple[str, int], List[int]] = {}
+
+    for event in events:
+        url_key = normalize_url(event.url)
+        title_key = normalize_title(event.title)
+        day = event.start.date().toordinal() if event.start else None
+
+        match = by_url.get(url_key) if url_key else None
+        if match is None and title_key and day is not None:
+            orgs = organizer_fingerprint(event)
+            for bucket in (day, day - 1, day + 1):
+                for index in by_title.get((title_key, bucket), ()):
+                    other_orgs = organizer_fingerprint(merged[index])
+                    if orgs and other_orgs and not (orgs & other_orgs):
+                        continue
+                    match = index
+                    break
+                if match is not None:
+                    break
+
+        if match is not None:
+            _merge_into(merged[match], event)
+        else:
+            match = len(merged)
+            # Copy, the scrapers' cached events must stay untouched
+            merged.append(dataclasses.replace(event))
+            if title_key and day is not None:
+                by_title.setdefault((title_key, day), []).append(match)
+
+        if url_key:
+            by_url.setdefault(url_key, match)
+
+    return merged
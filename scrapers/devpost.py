@@ -0,0 +1,100 @@
+import re
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+from .base import BaseScraper
+from .http_client import HttpClient
+from .models import Event, Source
+
+# "Oct 01 - 31, 2026", "Sep 20 - Oct 15, 2026" or "Dec 28, 2025 - Jan 05, 2026"
+PERIOD_RE = re.compile(
+    r'(?P<m1>[A-Za-z]{3})\w*\s+(?P<d1>\d{1,2})(?:,\s*(?P<y1>\d{4}))?\s*-\s*'
+    r'(?:(?P<m2>[A-Za-z]{3})\w*\s+)?(?P<d2>\d{1,2}),\s*(?P<y2>\d{4})'
+)
+# prize_amount comes as an HTML snippet, e.g. "$<span data-currency-value>10,000</span>"
+TAG_RE = re.compile(r'<[^>]+>')
+
+def parse_submission_period(text: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Turns a hackathon's submission period into (start, end), both None if it can't be read.
+    """
+    match = PERIOD_RE.search(text or '')
+    if not match:
+        return None, None
+    m1, d1, y1 = match.group('m1'), match.group('d1'), match.group('y1')
+    m2, d2, y2 = match.group('m2') or m1, match.group('d2'), match.group('y2')
+    try:
+        end = datetime.strptime(f"{m2} {d2} {y2}", "%b %d %Y").replace(tzinfo=timezone.utc)
+        start = datetime.strptime(f"{m1} {d1} {y1 or y2}", "%b %d %Y").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None, None
+    if start > end:
+        # "Dec 28 - Jan 05, 2026" without a first year spans new year
+        start = start.replace(year=start.year - 1)
+    return start, end
+
+class DevpostScraper(BaseScraper):
+    name = "Devpost"
+    timeout = 30
+    # Hackathons are announced weeks ahead
+    min_poll_interval = 15 * 60
+    max_poll_interval = 3 * 60 * 60
+
+    def __init__(self):
+        super().__init__()
+        # The hackathons page renders its listing from this endpoint in the browser
+        self.api_url = "https://devpost.com/api/hackathons"
+
+    async def iter_pages(self, client: HttpClient, max_pages: int = 5):
+        """
+        Fetch open and upcoming hackathons from the Devpost listing API, one page at a time.
+        """
+        for page in range(1, max_pages + 1):
+            params = [('status[]', 'upcoming'), ('status[]', 'open'), ('page', page)]
+            key = f"{self.api_url}#{page}"
+            data = await self._fetch_json(client, self.api_url, params=params, key=key)
+            if data is None:
+                events, changed = self._recall_page(key)
+            else:
+                events, changed = self._remember_page(key, self.normalize(data.get('hackathons') or []))
+
+            yield events, changed
+
+            if not events or self._is_last_page(data, page):
+                return
+
+    def _is_last_page(self, data: Optional[Dict], page: int) -> bool:
+        # Unchanged pages carry no meta, keep walking like the previous poll did
+        meta = (data or {}).get('meta') or {}
+        total, per_page = meta.get('total_count'), meta.get('per_page')
+        return bool(total is not None and per_page and page * per_page >= total)
+
+    def _normalize(self, hackathons: List[Dict]) -> List[Event]:
+        normalized = []
+        for hackathon in hackathons:
+            if not isinstance(hackathon, dict) or not hackathon.get('url') or not hackathon.get('title'):
+                continue
+            start, end = parse_submission_period(hackathon.get('submission_period_dates'))
+            thumbnail = hackathon.get('thumbnail_url')
+            if thumbnail and thumbnail.startswith('//'):
+                thumbnail = 'https:' + thumbnail
+            themes = [theme.get('name') for theme in hackathon.get('themes') or [] if theme.get('name')]
+            description = ', '.join(themes) or 'No description.'
+            prize = TAG_RE.sub('', hackathon.get('prize_amount') or '').strip()
+            if prize:
+                description = f"{description}\nPrizes: {prize}"
+            location = ((hackathon.get('displayed_location') or {}).get('location') or 'Online').strip()
+            host = hackathon.get('organization_name')
+
+            normalized.append(Event(
+                source=Source.DEVPOST,
+                title=hackathon['title'].strip(),
+                description=description,
+                start=start,
+                end=end,
+                url=hackathon['url'],
+                type='Hackathon',
+                logo_url=thumbnail,
+                organizers=(host,) if host else (),
+                onsite=location.lower() != 'online',
+            ))
+        return normalized
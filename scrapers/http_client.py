@@ -0,0 +1,195 @@
+import asyncio
+import random
+import time
+from typing import Dict, Optional
+import aiohttp
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# A hung upstream gives up after these many seconds instead of blocking a command
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 20
+# Keep-alive connections kept open per host
+CONNECTIONS_PER_HOST = 8
+KEEPALIVE_TIMEOUT = 30
+
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.5
+MAX_RETRY_DELAY = 10.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Consecutive failures that open a source's circuit, and how long it stays open
+BREAKER_THRESHOLD = 3
+BREAKER_RESET_AFTER = 60.0
+
+class HttpError(Exception):
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} from {url}")
+        self.status = status
+        self.url = url
+
+class CircuitOpenError(Exception):
+    def __init__(self, source: str, retry_in: float):
+        super().__init__(f"{source} is failing, skipping requests for {retry_in:.0f}s")
+        self.source = source
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """
+    Counts consecutive failures of one upstream. Once open, requests fail immediately
+    until reset_after has passed, then a single trial request decides whether it closes.
+    """
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, reset_after: float = BREAKER_RESET_AFTER):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    def retry_in(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_after - time.monotonic())
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self.retry_in() > 0:
+            return False
+        # Half open: this caller makes the trial request, everyone else keeps failing fast
+        self.opened_at = time.monotonic()
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+class HttpResponse:
+    __slots__ = ('status', 'headers', 'body', 'url')
+
+    def __init__(self, status: int, headers, body: bytes, url: str):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.url = url
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise HttpError(self.status, self.url)
+
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    # Full jitter keeps retries from several commands from arriving together
+    return min(RETRY_BACKOFF * (2 ** attempt), MAX_RETRY_DELAY) * random.uniform(0.5, 1.0)
+
+class HttpClient:
+    """
+    Shared HTTP client: one keep-alive connection pool, explicit connect/read timeouts,
+    jittered retries for transient errors and a circuit breaker per source.
+    """
+    def __init__(self, headers: Dict = None, retries: int = MAX_RETRIES):
+        self.headers = headers or DEFAULT_HEADERS
+        self.retries = retries
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._breakers: Dict[str, CircuitBreaker] = {} # Structure: {source: breaker}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so it binds to the running event loop
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=CONNECTIONS_PER_HOST,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=300,
+            )
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers)
+            self._loop = loop
+        return self._session
+
+    def breaker(self, source: str) -> CircuitBreaker:
+        breaker = self._breakers.get(source)
+        if breaker is None:
+            breaker = self._breakers[source] = CircuitBreaker()
+        return breaker
+
+    def is_available(self, source: str) -> bool:
+        """
+        False while the source's circuit is open, callers can serve cached data instead.
+        """
+        return self.breaker(source).retry_in() <= 0
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def get(self, url: str, source: str = None, **kwargs) -> HttpResponse:
+        return await self.request('GET', url, source=source, **kwargs)
+
+    async def request(self, method: str, url: str, source: str = None, **kwargs) -> HttpResponse:
+        """
+        Sends the request and reads the body. Connection errors, timeouts, 429 and 5xx
+        answers are retried with jittered backoff; the final result counts towards the
+        source's circuit breaker. Raises CircuitOpenError while the circuit is open.
+        Other statuses are returned as is, use raise_for_status to turn them into errors.
+        """
+        breaker = self.breaker(source or url)
+        if not breaker.allow():
+            raise CircuitOpenError(source or url, breaker.retry_in())
+
+        session = self._get_session()
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    body = await response.read()
+                    result = HttpResponse(response.status, response.headers, body, str(response.url))
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError):
+                if last:
+                    breaker.record_failure()
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+
+            if result.status in RETRY_STATUSES:
+                if last:
+                    breaker.record_failure()
+                    return result
+                await asyncio.sleep(_retry_delay(attempt, result.headers.get('Retry-After')))
+                continue
+
+            breaker.record_success()
+            return result
+
+_client: Optional[HttpClient] = None
+
+def get_client() -> HttpClient:
+    """
+    The process wide client shared by the scrapers and the cogs.
+    """
+    global _client
+    if _client is None:
+        _client = HttpClient()
+    return _client
+
+async def close_client():
+    if _client is not None:
+        await _client.close()
@@ -1,32 +1,220 @@
-from typing import List, Dict
+import asyncio
+import time
+from typing import List, Dict, Optional
+from metrics import CACHE_REQUESTS, POLLS, SCRAPE_SECONDS
 from .ctftime import CTFTimeScraper
 from .unstop import UnstopScraper
+from .devpost import DevpostScraper
+from .catalog import EventCatalog, filter_args
+from .dedup import merge_events
+from .http_client import CircuitOpenError, HttpClient, get_client
+from .models import Event
+from .polling import AdaptivePoller
+from .snapshot import load_snapshot, save_snapshot
+
+# Upstream listings change a few times a day, 15 minutes keeps them fresh enough.
+# Only the starting point, each source's interval then adapts to how often it changes.
+DEFAULT_TTL = 15 * 60
+
+class _CacheEntry:
+    __slots__ = ('events', 'fetched_at')
+
+    def __init__(self, events: List[Event], fetched_at: float):
+        self.events = events
+        self.fetched_at = fetched_at
 
 class ScraperManager:
-    def __init__(self):
+    def __init__(self, ttl: float = DEFAULT_TTL, client: HttpClient = None, snapshot_path: str = None):
+        # Order is merge priority, the first source to report an event owns its ID
         self.scrapers = [
             CTFTimeScraper(),
-            UnstopScraper()
+            UnstopScraper(),
+            DevpostScraper()
         ]
-
-    def get_all_events(self, type_filter: str = None) -> List[Dict]:
-        all_events = []
+        self.ttl = ttl
+        # When each source is due again, tracked per source from its change history
+        self.poller = AdaptivePoller(ttl)
         for scraper in self.scrapers:
-            # We could optimize by only calling relevant scrapers
-            # but for now fetching all is fine (<50 reqs)
+            self.poller.register(scraper.name, scraper.min_poll_interval, scraper.max_poll_interval)
+        # Connection pool, retries and circuit breakers are shared with the rest of the bot
+        self.client = client or get_client()
+        self._cache: Dict[str, _CacheEntry] = {} # Structure: {source_name: entry}
+        self._inflight: Dict[str, asyncio.Task] = {} # Structure: {source_name: refresh task}
+        # Bumped whenever any source returns different content, lets callers skip re-diffing
+        self.version = 0
+        self.catalog = EventCatalog()
+        self._merged_inputs: Optional[List[List[Event]]] = None
+        # Warm start: the last scraped catalog is read back from disk on first use
+        self.snapshot_path = snapshot_path
+        self._snapshot_load: Optional[asyncio.Task] = None
+        self._snapshot_save: Optional[asyncio.Task] = None
+        self._snapshot_dirty = False
+
+    async def close(self):
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
+        if self._snapshot_save is not None:
+            # Let the last write finish, it only replaces the file once complete
+            await asyncio.gather(self._snapshot_save, return_exceptions=True)
+
+    async def _load_snapshot(self):
+        snapshot = await asyncio.to_thread(load_snapshot, self.snapshot_path)
+        names = {scraper.name for scraper in self.scrapers}
+        now, now_mono = time.time(), time.monotonic()
+        for name, (fetched_at, events) in snapshot.items():
+            if name in names and name not in self._cache:
+                # Keep the snapshot's age, a young one is served without refetching
+                self._cache[name] = _CacheEntry(events, now_mono - (now - fetched_at))
+        if snapshot:
+            print(f"Warm start from catalog snapshot ({sum(len(events) for _, events in snapshot.values())} events).")
+
+    def _schedule_snapshot(self):
+        if self.snapshot_path is None:
+            return
+        if self._snapshot_save is not None and not self._snapshot_save.done():
+            # A write is running, it writes again once done
+            self._snapshot_dirty = True
+            return
+        self._snapshot_save = asyncio.ensure_future(self._write_snapshot())
+
+    async def _write_snapshot(self):
+        while True:
+            self._snapshot_dirty = False
+            now, now_mono = time.time(), time.monotonic()
+            sources = {
+                name: (now - (now_mono - entry.fetched_at), entry.events)
+                for name, entry in self._cache.items()
+            }
             try:
-                events = scraper.fetch_events()
-                all_events.extend(events)
+                await asyncio.to_thread(save_snapshot, self.snapshot_path, sources)
             except Exception as e:
-                print(f"Scraper failed: {e}")
-        
-        # Filter if needed
-        if type_filter:
-            if type_filter == 'CTF':
-                all_events = [e for e in all_events if e.get('source') == 'CTFtime']
-            elif type_filter == 'Hackathon':
-                all_events = [e for e in all_events if e.get('type') == 'Hackathon']
-        
-        # Sort by start date (handling None dates)
-        all_events.sort(key=lambda x: x.get('start_date') or '9999-99-99')
-        return all_events
+                print(f"Failed to write catalog snapshot: {e}")
+            if not self._snapshot_dirty:
+                return
+
+    async def _fetch_source(self, scraper) -> Optional[List[Event]]:
+        """
+        Returns the scraper's events, or None if the source failed, timed out or its circuit is open.
+        """
+        if not self.client.is_available(scraper.name):
+            # Upstream is known to be failing, don't make the caller wait on it
+            return None
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            events = await asyncio.wait_for(scraper.fetch_events(self.client), timeout=scraper.timeout)
+            outcome = 'ok'
+            return events
+        except CircuitOpenError:
+            outcome = 'circuit_open'
+        except asyncio.TimeoutError:
+            # The deadline cancels the request before the client can count it
+            self.client.breaker(scraper.name).record_failure()
+            outcome = 'timeout'
+            print(f"Scraper {scraper.name} timed out after {scraper.timeout}s")
+        except Exception as e:
+            print(f"Scraper {scraper.name} failed: {e}")
+        finally:
+            SCRAPE_SECONDS.observe(time.perf_counter() - started, source=scraper.name, outcome=outcome)
+        return None
+
+    async def _refresh_source(self, scraper) -> List[Event]:
+        events = await self._fetch_source(scraper)
+        if events is None:
+            self._record_poll(scraper, 'error')
+            # Keep serving the last good result rather than wiping the cache
+            entry = self._cache.get(scraper.name)
+            return entry.events if entry else []
+
+        changed = scraper.changed or scraper.name not in self._cache
+        self._record_poll(scraper, 'changed' if scraper.changed else 'unchanged')
+        if changed:
+            self.version += 1
+        self._cache[scraper.name] = _CacheEntry(events, time.monotonic())
+        if changed:
+            self._schedule_snapshot()
+        return events
+
+    def _record_poll(self, scraper, outcome: str):
+        POLLS.inc(source=scraper.name, outcome=outcome)
+        self.poller.record(scraper.name, outcome)
+
+    def _is_stale(self, scraper, entry: _CacheEntry) -> bool:
+        due = self.poller.due_at(scraper.name)
+        if due is None:
+            # Not polled by this process yet (warm start), go by the snapshot's age
+            return time.monotonic() - entry.fetched_at > self.ttl
+        return time.time() >= due
+
+    def next_poll_in(self) -> float:
+        """
+        Seconds until the next source is due, ttl if none was polled yet.
+        """
+        due = self.poller.next_due()
+        return self.ttl if due is None else max(0.0, due - time.time())
+
+    def _refresh(self, scraper) -> asyncio.Task:
+        # Single-flight: concurrent callers share the refresh already running
+        task = self._inflight.get(scraper.name)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh_source(scraper))
+            self._inflight[scraper.name] = task
+            task.add_done_callback(lambda _: self._inflight.pop(scraper.name, None))
+        return task
+
+    async def _get_source_events(self, scraper, fresh: bool) -> List[Event]:
+        # fresh lookups come from the background poll, kept apart so commands get their own hit ratio
+        caller = 'poll' if fresh else 'query'
+        entry = self._cache.get(scraper.name)
+        if entry is not None:
+            stale = self._is_stale(scraper, entry)
+            if not stale:
+                CACHE_REQUESTS.inc(source=scraper.name, result='hit', caller=caller)
+                return entry.events
+            if not fresh:
+                # Stale-while-revalidate: answer now, refresh in the background
+                CACHE_REQUESTS.inc(source=scraper.name, result='stale', caller=caller)
+                self._refresh(scraper)
+                return entry.events
+
+        CACHE_REQUESTS.inc(source=scraper.name, result='miss', caller=caller)
+        # Shielded so a cancelled command does not abort the shared fetch
+        return await asyncio.shield(self._refresh(scraper))
+
+    async def _sync_catalog(self, fresh: bool = False):
+        if self.snapshot_path is not None:
+            if self._snapshot_load is None:
+                self._snapshot_load = asyncio.ensure_future(self._load_snapshot())
+            await asyncio.shield(self._snapshot_load)
+
+        # Query every source at once, a slow source only costs its own timeout
+        results = await asyncio.gather(
+            *(self._get_source_events(scraper, fresh) for scraper in self.scrapers)
+        )
+
+        # Merging only reruns when some source delivered a different list.
+        # The inputs are kept referenced so identity comparison stays valid.
+        inputs = self._merged_inputs
+        if inputs is None or len(inputs) != len(results) or any(a is not b for a, b in zip(inputs, results)):
+            all_events = []
+            for events in results:
+                all_events.extend(events)
+            # The catalog only re-indexes events that are new, gone or moved
+            self.catalog.update(merge_events(all_events))
+            self._merged_inputs = results
+
+    async def get_all_events(self, type_filter: str = None, fresh: bool = False) -> List[Event]:
+        """
+        Returns events from every source sorted by start date, served from the per-source cache when possible.
+        With fresh=True sources that are due are refetched before returning instead of in the background.
+        """
+        await self._sync_catalog(fresh)
+        return self.catalog.query(**filter_args(type_filter))
+
+    async def get_events(self, type_filter: str = None, limit: int = None, start=None, end=None) -> List[Event]:
+        """
+        Returns at most `limit` events starting in [start, end), answered from the catalog indexes.
+        """
+        await self._sync_catalog()
+        return self.catalog.query(start=start, end=end, limit=limit, **filter_args(type_filter))
@@ -0,0 +1,130 @@
+import hashlib
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Dict, Optional, Tuple
+
+class Source(str, Enum):
+    CTFTIME = 'CTFtime'
+    UNSTOP = 'Unstop'
+    DEVPOST = 'Devpost'
+
+    def __str__(self):
+        return self.value
+
+def event_id_from_url(url: str) -> str:
+    # Short, stable key for an event, safe to use in the state store
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+
+# Sorts events without a start date last
+NO_START = float('inf')
+
+def parse_datetime(value) -> Optional[datetime]:
+    """
+    Parses an ISO date once at the pipeline edge, offset naive values are taken as UTC.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # Formats repeat across every event, share one string object per value
+    return sys.intern(value) if isinstance(value, str) else value
+
+@dataclass(slots=True, eq=False)
+class Event:
+    source: Source
+    title: str
+    url: Optional[str]
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    description: str = 'No description.'
+    ctftime_url: Optional[str] = None
+    type: Optional[str] = None
+    logo_url: Optional[str] = None
+    organizers: Tuple[str, ...] = ()
+    weight: float = 0.0
+    onsite: bool = False
+    id: Optional[str] = None
+    # Filled by the merge stage when other sources report the same event
+    sources: Tuple[Source, ...] = ()
+    alt_urls: Tuple[str, ...] = ()
+    sort_key: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.type = _intern(self.type)
+        if self.id is None and self.url:
+            self.id = event_id_from_url(self.url)
+        if not self.sources:
+            self.sources = (self.source,)
+        self.sort_key = self.start.timestamp() if self.start else NO_START
+
+    @property
+    def start_ts(self) -> Optional[float]:
+        return self.start.timestamp() if self.start else None
+
+    @property
+    def end_ts(self) -> Optional[float]:
+        return self.end.timestamp() if self.end else None
+
+    def all_ids(self) -> Dict[str, Optional[str]]:
+        """
+        {event_id: url} for the canonical ID and the URLs other sources list the event under.
+        The canonical ID follows whichever source reported first, so it can change between polls.
+        """
+        ids = {self.id: self.url} if self.id else {}
+        for url in self.alt_urls:
+            ids.setdefault(event_id_from_url(url), url)
+        return ids
+
+    def to_dict(self) -> Dict:
+        """
+        JSON friendly form, used by the state store and debug dumps.
+        """
+        return {
+            'id': self.id,
+            'source': self.source.value,
+            'title': self.title,
+            'description': self.description,
+            'start_date': self.start.isoformat() if self.start else None,
+            'end_date': self.end.isoformat() if self.end else None,
+            'url': self.url,
+            'ctftime_url': self.ctftime_url,
+            'type': self.type,
+            'logo_url': self.logo_url,
+            'organizers': list(self.organizers),
+            'weight': self.weight,
+            'onsite': self.onsite,
+            'sources': [source.value for source in self.sources],
+            'alt_urls': list(self.alt_urls),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Event':
+        return cls(
+            source=Source(data.get('source')),
+            title=data.get('title') or 'Unknown Event',
+            url=data.get('url'),
+            start=parse_datetime(data.get('start_date')),
+            end=parse_datetime(data.get('end_date')),
+            description=data.get('description') or 'No description.',
+            ctftime_url=data.get('ctftime_url'),
+            type=data.get('type'),
+            logo_url=data.get('logo_url'),
+            organizers=tuple(data.get('organizers') or ()),
+            weight=data.get('weight') or 0.0,
+            onsite=bool(data.get('onsite')),
+            id=data.get('id'),
+            sources=tuple(Source(s) for s in data.get('sources') or ()),
+            alt_urls=tuple(data.get('alt_urls') or ()),
+        )
@@ -0,0 +1,125 @@
+import random
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Weight of the newest gap in the running average of time between changes
+GAP_SMOOTHING = 0.3
+# Polling at half the typical gap between changes catches most of them early
+GAP_FRACTION = 0.5
+# Growth of the interval after a poll that found nothing new
+UNCHANGED_BACKOFF = 1.5
+# Consecutive errors double the delay up to the source's max interval
+ERROR_BACKOFF = 2.0
+# Hours of the day (UTC) with many past changes are polled this much more often
+BUSY_SPEEDUP = 2.0
+BUSY_RATIO = 1.5
+BUSY_MIN_CHANGES = 6
+# Older change hours fade out, so a source's schedule can drift
+HOUR_DECAY = 0.95
+# Every delay is stretched or shrunk by up to this fraction, sources drift apart
+JITTER = 0.1
+
+class _PollState:
+    __slots__ = ('min_interval', 'max_interval', 'interval', 'next_due', 'last_change',
+                 'change_gap', 'errors', 'hour_changes')
+
+    def __init__(self, min_interval: float, max_interval: float, interval: float):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = interval
+        self.next_due: Optional[float] = None
+        self.last_change: Optional[float] = None
+        self.change_gap: Optional[float] = None
+        self.errors = 0
+        self.hour_changes = [0.0] * 24
+
+class AdaptivePoller:
+    """
+    Decides when each source is polled next. The interval follows how often the source's
+    content actually changes, within the source's bounds: it tightens after changes, grows
+    after unchanged polls, backs off exponentially on errors and shrinks around the hours
+    of the day changes usually come in. Times are wall clock seconds.
+    """
+    def __init__(self, initial_interval: float):
+        self.initial_interval = initial_interval
+        self._sources: Dict[str, _PollState] = {} # Structure: {source_name: state}
+
+    def register(self, name: str, min_interval: float, max_interval: float):
+        interval = min(max(self.initial_interval, min_interval), max_interval)
+        self._sources[name] = _PollState(min_interval, max_interval, interval)
+
+    def _state(self, name: str) -> _PollState:
+        state = self._sources.get(name)
+        if state is None:
+            state = self._sources[name] = _PollState(self.initial_interval, self.initial_interval, self.initial_interval)
+        return state
+
+    def due_at(self, name: str) -> Optional[float]:
+        """
+        When the source should be polled next, None if it was never polled.
+        """
+        state = self._sources.get(name)
+        return state.next_due if state is not None else None
+
+    def next_due(self) -> Optional[float]:
+        dues = [state.next_due for state in self._sources.values() if state.next_due is not None]
+        return min(dues) if dues else None
+
+    def poll_now(self, name: str):
+        self._state(name).next_due = time.time()
+
+    def interval(self, name: str) -> float:
+        return self._state(name).interval
+
+    def intervals(self) -> Dict[str, float]:
+        return {name: state.interval for name, state in self._sources.items()}
+
+    def _is_busy(self, state: _PollState, now: float) -> bool:
+        total = sum(state.hour_changes)
+        if total < BUSY_MIN_CHANGES:
+            return False
+        hour = datetime.fromtimestamp(now, timezone.utc).hour
+        # The coming hour counts too, so polling speeds up before a busy hour starts
+        recent = max(state.hour_changes[hour], state.hour_changes[(hour + 1) % 24])
+        return recent >= BUSY_RATIO * total / 24
+
+    def record(self, name: str, outcome: str, now: float = None):
+        """
+        Records a poll's outcome ('changed', 'unchanged' or 'error') and schedules the next one.
+        """
+        now = time.time() if now is None else now
+        state = self._state(name)
+
+        if outcome == 'error':
+            state.errors += 1
+            delay = state.interval * ERROR_BACKOFF ** state.errors
+        else:
+            state.errors = 0
+            if outcome == 'changed' and state.last_change is None:
+                # The first poll has nothing to compare against, it only starts the clock
+                state.last_change = now
+            elif outcome == 'changed':
+                gap = now - state.last_change
+                state.change_gap = gap if state.change_gap is None else \
+                    (1 - GAP_SMOOTHING) * state.change_gap + GAP_SMOOTHING * gap
+                # A change always tightens, the average catches up over the next ones
+                state.interval = min(state.change_gap * GAP_FRACTION, state.interval / UNCHANGED_BACKOFF)
+                state.last_change = now
+                hours = state.hour_changes
+                for i in range(24):
+                    hours[i] *= HOUR_DECAY
+                hours[datetime.fromtimestamp(now, timezone.utc).hour] += 1
+            else:
+                grown = state.interval * UNCHANGED_BACKOFF
+                # Nothing new yet is expected below the usual gap, don't drift far past it
+                if state.change_gap is not None:
+                    grown = min(grown, max(state.change_gap, state.interval))
+                state.interval = grown
+            state.interval = min(max(state.interval, state.min_interval), state.max_interval)
+            delay = state.interval / BUSY_SPEEDUP if self._is_busy(state, now) else state.interval
+
+        # Clamped after the jitter so the bounds hold for the actual delay
+        delay *= random.uniform(1 - JITTER, 1 + JITTER)
+        state.next_due = now + min(max(delay, state.min_interval), state.max_interval)
+
@@ -0,0 +1,115 @@
+import marshal
+import os
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from .models import Event, Source
+
+# File layout: MAGIC, then a zlib compressed marshal dump of the payload
+MAGIC = b'EVSNAP1\n'
+# Older snapshots are ignored, their events would mostly be gone upstream
+MAX_AGE = 24 * 60 * 60
+
+# Stored column by column: one list per field, shared values compress well
+FIELDS = (
+    'source', 'title', 'url', 'start', 'end', 'description', 'ctftime_url', 'type',
+    'logo_url', 'organizers', 'weight', 'onsite', 'id', 'sources', 'alt_urls',
+)
+
+def _encode_dt(dt: Optional[datetime]) -> Optional[Tuple[float, int]]:
+    # Timestamp plus UTC offset so the original timezone survives the round trip
+    if dt is None:
+        return None
+    return dt.timestamp(), int(dt.utcoffset().total_seconds())
+
+def _decode_dt(value) -> Optional[datetime]:
+    if value is None:
+        return None
+    ts, offset = value
+    return datetime.fromtimestamp(ts, timezone(timedelta(seconds=offset)))
+
+def _encode(events: List[Event]) -> Dict[str, list]:
+    columns = {name: [] for name in FIELDS}
+    for event in events:
+        columns['source'].append(event.source.value)
+        columns['title'].append(event.title)
+        columns['url'].append(event.url)
+        columns['start'].append(_encode_dt(event.start))
+        columns['end'].append(_encode_dt(event.end))
+        columns['description'].append(event.description)
+        columns['ctftime_url'].append(event.ctftime_url)
+        columns['type'].append(event.type)
+        columns['logo_url'].append(event.logo_url)
+        columns['organizers'].append(tuple(event.organizers))
+        columns['weight'].append(float(event.weight or 0.0))
+        columns['onsite'].append(bool(event.onsite))
+        columns['id'].append(event.id)
+        columns['sources'].append(tuple(source.value for source in event.sources))
+        columns['alt_urls'].append(tuple(event.alt_urls))
+    return columns
+
+def _decode(columns: Dict[str, list]) -> List[Event]:
+    events = []
+    for row in zip(*(columns[name] for name in FIELDS)):
+        (source, title, url, start, end, description, ctftime_url, type_,
+         logo_url, organizers, weight, onsite, event_id, sources, alt_urls) = row
+        events.append(Event(
+            source=Source(source),
+            title=title,
+            url=url,
+            start=_decode_dt(start),
+            end=_decode_dt(end),
+            description=description,
+            ctftime_url=ctftime_url,
+            type=type_,
+            logo_url=logo_url,
+            organizers=organizers,
+            weight=weight,
+            onsite=onsite,
+            id=event_id,
+            sources=tuple(Source(s) for s in sources),
+            alt_urls=alt_urls,
+        ))
+    return events
+
+def save_snapshot(path: str, sources: Dict[str, Tuple[float, List[Event]]]):
+    """
+    Writes {source name: (fetched_at wall clock, events)} to path. The file is replaced
+    atomically, a crash mid-write leaves the previous snapshot intact.
+    """
+    payload = {
+        'saved_at': time.time(),
+        'sources': {name: (fetched_at, _encode(events)) for name, (fetched_at, events) in sources.items()},
+    }
+    data = MAGIC + zlib.compress(marshal.dumps(payload), 6)
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def load_snapshot(path: str, max_age: float = MAX_AGE) -> Dict[str, Tuple[float, List[Event]]]:
+    """
+    Reads a snapshot written by save_snapshot. Returns {} if it is missing, too old,
+    written by an incompatible version or damaged.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            return {}
+        payload = marshal.loads(zlib.decompress(data[len(MAGIC):]))
+        if time.time() - payload['saved_at'] > max_age:
+            return {}
+        return {name: (fetched_at, _decode(columns)) for name, (fetched_at, columns) in payload['sources'].items()}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        # marshal is tied to the Python version, a snapshot from another one is just skipped
+        print(f"Ignoring catalog snapshot {path}: {e}")
+        return {}
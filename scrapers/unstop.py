@@ -1,49 +1,71 @@
-import requests
 from .base import BaseScraper
+from .http_client import HttpClient
+from .models import Event, Source, parse_datetime
 from typing import List, Dict
 
 class UnstopScraper(BaseScraper):
-    def fetch_events(self) -> List[Dict]:
+    name = "Unstop"
+    timeout = 30
+    # Listing is sorted newest first
+    incremental = True
+
+    def __init__(self):
+        super().__init__()
+        # Changed to 'competitions' and 'oppstatus=open' to match user request
+        self.api_url = "https://unstop.com/api/public/opportunity/search-result"
+        self._last_pages: Dict[str, int] = {}
+
+    async def iter_pages(self, client: HttpClient, per_page: int = 20, max_pages: int = 10):
         """
-        Fetch upcoming Competitions/Hackathons from Unstop API.
+        Fetch upcoming Competitions/Hackathons from Unstop API, one page at a time.
         Matching: https://unstop.com/competitions?oppstatus=open
         """
-        # Changed to 'competitions' and 'oppstatus=open' to match user request
-        api_url = "https://unstop.com/api/public/opportunity/search-result?opportunity=competitions&oppstatus=open&per_page=20"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        try:
-            response = requests.get(api_url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            print(f"DEBUG: Unstop response type: {type(data)}")
-            # If it's a list, print first item keys to understand structure
-            if isinstance(data, list) and len(data) > 0:
-                 print(f"DEBUG: First item in list: {str(data[0])[:100]}")
+        for page in range(1, max_pages + 1):
+            params = {
+                'opportunity': 'competitions',
+                'oppstatus': 'open',
+                'per_page': per_page,
+                'page': page,
+            }
+            key = f"{self.api_url}#{page}"
+            data = await self._fetch_json(client, self.api_url, params=params, key=key)
+            if data is None:
+                # 304 or identical payload, nothing to re-normalize
+                events, changed = self._recall_page(key)
+                last_page = self._last_pages.get(key)
+            else:
+                opportunities, last_page = self._extract(data)
+                self._last_pages[key] = last_page
+                events, changed = self._remember_page(key, self.normalize(opportunities))
 
-            opportunities = []
-            
-            # Case 1: Standard Dict Response { data: { data: [] } }
-            if isinstance(data, dict) and 'data' in data:
-                inner = data['data']
-                if isinstance(inner, dict) and 'data' in inner:
-                    opportunities = inner['data']
-                elif isinstance(inner, list):
-                     opportunities = inner
-            
-            # Case 2: Direct List Response (possible protection/variation) [ ... ]
-            elif isinstance(data, list):
-                opportunities = data
+            yield events, changed
+
+            if not events or (last_page and page >= last_page):
+                return
+
+    def _extract(self, data):
+        """
+        Returns (opportunities, last_page) from an API response, last_page is None if unknown.
+        """
+        opportunities = []
+        last_page = None
+        
+        # Case 1: Standard Dict Response { data: { data: [], last_page: n } }
+        if isinstance(data, dict) and 'data' in data:
+            inner = data['data']
+            if isinstance(inner, dict) and 'data' in inner:
+                opportunities = inner['data']
+                last_page = inner.get('last_page')
+            elif isinstance(inner, list):
+                 opportunities = inner
+        
+        # Case 2: Direct List Response (possible protection/variation) [ ... ]
+        elif isinstance(data, list):
+            opportunities = data
 
-            return self._normalize(opportunities)
-        except Exception as e:
-            # print(f"Error fetching Unstop events: {e}") # Reduce log spam if frequent
-            return []
+        return opportunities, last_page
 
-    def _normalize(self, events: List[Dict]) -> List[Dict]:
+    def _normalize(self, events: List[Dict]) -> List[Event]:
         normalized = []
         for event in events:
             if not isinstance(event, dict):
@@ -58,18 +80,18 @@ class UnstopScraper(BaseScraper):
             # Dates in Unstop might be ISO or specific format. 
             # Often they have 'start_date' and 'end_date' fields.
             
-            normalized.append({
-                'source': 'Unstop',
-                'title': event.get('title'),
-                'description': event.get('filters', {}).get('about', 'No description.'), # specific to unstop structure? or just generic
-                'start_date': event.get('start_date'),
-                'end_date': event.get('end_date'),
-                'url': url,
-                'ctftime_url': None,
-                'type': 'Hackathon', # Explicitly set as Hackathon
-                'logo_url': event.get('logo_url'), # or 'logo'
-                'organizers': [event.get('organisation', {}).get('name', 'Unknown')],
-                'weight': 0,
-                'onsite': event.get('region') != 'Online', # simplistic check
-            })
+            normalized.append(Event(
+                source=Source.UNSTOP,
+                title=event.get('title'),
+                description=(event.get('filters') or {}).get('about') or 'No description.', # specific to unstop structure? or just generic
+                start=parse_datetime(event.get('start_date')),
+                end=parse_datetime(event.get('end_date')),
+                url=url,
+                ctftime_url=None,
+                type='Hackathon', # Explicitly set as Hackathon
+                logo_url=event.get('logo_url'), # or 'logo'
+                organizers=((event.get('organisation') or {}).get('name', 'Unknown'),),
+                weight=0,
+                onsite=event.get('region') != 'Online', # simplistic check
+            ))
         return normalized
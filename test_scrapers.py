@@ -1,20 +1,29 @@
 from scrapers.manager import ScraperManager
+from scrapers.http_client import close_client
+import asyncio
 import json
 
-def main():
+async def fetch():
     manager = ScraperManager()
+    try:
+        return await manager.get_all_events()
+    finally:
+        await manager.close()
+        await close_client()
+
+def main():
     print("Fetching events...")
-    events = manager.get_all_events()
+    events = asyncio.run(fetch())
     print(f"Found {len(events)} events.")
     
     if events:
         print("\nTop 3 Upcoming Events:")
         for event in events[:3]:
-            print(f"- {event['title']} ({event['start_date']})")
+            print(f"- {event.title} ({event.start})")
         
         # Save to a debug file
         with open('debug_events.json', 'w') as f:
-            json.dump(events, f, indent=2)
+            json.dump([event.to_dict() for event in events], f, indent=2)
             print("\nSaved all events to debug_events.json")
     else:
         print("No events found. Check network or API.")
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+from scrapers.catalog import EventCatalog
+from scrapers.models import Event, Source
+
+START = datetime(2026, 11, 7, 12, 0, tzinfo=timezone.utc)
+
+def make_event(n: int, **kwargs):
+    fields = {'source': Source.CTFTIME, 'title': f"Event {n}", 'url': f"https://example.org/{n}", 'start': START}
+    fields.update(kwargs)
+    return Event(**fields)
+
+def test_first_update_reports_everything_as_added():
+    catalog = EventCatalog()
+    catalog.update([make_event(1), make_event(2)])
+    changes = catalog.drain_changes()
+    assert sorted(event.title for event in changes.added) == ["Event 1", "Event 2"]
+    assert not changes.updated and not changes.removed
+
+def test_drain_clears_the_changes():
+    catalog = EventCatalog()
+    catalog.update([make_event(1)])
+    catalog.drain_changes()
+    catalog.update([make_event(1)])
+    assert not catalog.drain_changes()
+
+def test_updated_event_lists_the_changed_fields():
+    catalog = EventCatalog()
+    catalog.update([make_event(1), make_event(2)])
+    catalog.drain_changes()
+    catalog.update([make_event(1, start=START + timedelta(days=1), title="Renamed"), make_event(2)])
+    changes = catalog.drain_changes()
+    assert len(changes.updated) == 1
+    old, new, fields = changes.updated[0]
+    assert old.title == "Event 1" and new.title == "Renamed"
+    assert set(fields) == {'title', 'start'}
+    assert not changes.added and not changes.removed
+
+def test_removed_event_is_reported_with_its_last_version():
+    catalog = EventCatalog()
+    catalog.update([make_event(1), make_event(2)])
+    catalog.drain_changes()
+    catalog.update([make_event(2)])
+    changes = catalog.drain_changes()
+    assert [event.title for event in changes.removed] == ["Event 1"]
+    assert not changes.added and not changes.updated
+
+def test_net_changes_between_drains():
+    catalog = EventCatalog()
+    catalog.update([make_event(1)])
+    catalog.drain_changes()
+    # Changed and changed back: nothing to report
+    catalog.update([make_event(1, title="Typo")])
+    catalog.update([make_event(1)])
+    # Added and gone again before the drain: nothing to report either
+    catalog.update([make_event(1), make_event(3)])
+    catalog.update([make_event(1)])
+    assert not catalog.drain_changes()
+
+def test_same_instant_in_another_offset_is_not_an_update():
+    catalog = EventCatalog()
+    catalog.update([make_event(1)])
+    catalog.drain_changes()
+    shifted = START.astimezone(timezone(timedelta(hours=5, minutes=30)))
+    catalog.update([make_event(1, start=shifted)])
+    assert not catalog.drain_changes().updated
+
+def make_catalog():
+    catalog = EventCatalog()
+    catalog.update([
+        make_event(1, start=START),
+        make_event(2, start=START + timedelta(days=1), source=Source.DEVPOST, type='Hackathon'),
+        make_event(3, start=START + timedelta(days=2)),
+        make_event(4, start=None),
+        make_event(5, start=START + timedelta(days=3), type='Hackathon'),
+    ])
+    return catalog
+
+def titles(events):
+    return [event.title for event in events]
+
+def test_query_orders_by_start_with_undated_events_last():
+    assert titles(make_catalog().query()) == ["Event 1", "Event 2", "Event 3", "Event 5", "Event 4"]
+
+def test_query_window_is_half_open_and_skips_undated_events():
+    catalog = make_catalog()
+    assert titles(catalog.query(start=START + timedelta(days=1), end=START + timedelta(days=3))) == ["Event 2", "Event 3"]
+    # Timestamps work like datetimes, an open end still leaves undated events out
+    assert titles(catalog.query(start=(START + timedelta(days=2)).timestamp())) == ["Event 3", "Event 5"]
+
+def test_query_limit_applies_after_the_filters():
+    catalog = make_catalog()
+    assert titles(catalog.query(limit=2)) == ["Event 1", "Event 2"]
+    assert titles(catalog.query(source=Source.CTFTIME, limit=2)) == ["Event 1", "Event 3"]
+    assert titles(catalog.query(type='Hackathon', start=START, limit=1)) == ["Event 2"]
+    assert titles(catalog.query(source=Source.CTFTIME, type='Hackathon', limit=5)) == ["Event 5"]
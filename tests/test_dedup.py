@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from scrapers.dedup import merge_events, normalize_title
+from scrapers.models import Event, Source, event_id_from_url
+
+START = datetime(2026, 11, 7, 12, 0, tzinfo=timezone.utc)
+
+def make_event(source=Source.CTFTIME, title="Foo CTF 2026", url="https://foo.example/", start=START, **kwargs):
+    return Event(source=source, title=title, url=url, start=start, **kwargs)
+
+def test_normalize_title_strips_years_fillers_and_glued_suffixes():
+    assert normalize_title("FooCTF 2026") == "foo"
+    assert normalize_title("The Foo CTF - Online Qualifier") == "foo"
+    assert normalize_title("Fóo Hackathon Edition") == "foo"
+    assert normalize_title("Foo Bar CTF") == "foo bar"
+    assert normalize_title(None) == ''
+
+def test_same_url_merges_across_sources():
+    primary = make_event()
+    duplicate = make_event(source=Source.UNSTOP, title="Something else", url="http://www.FOO.example", start=None)
+    merged = merge_events([primary, duplicate])
+    assert len(merged) == 1
+    assert merged[0].sources == (Source.CTFTIME, Source.UNSTOP)
+
+def test_same_title_within_a_day_merges_and_fills_gaps():
+    primary = make_event(description='', logo_url=None)
+    duplicate = make_event(source=Source.UNSTOP, title="FooCTF", url="https://unstop.com/foo",
+                           start=START + timedelta(hours=20), description="About Foo", logo_url="https://img/foo.png")
+    merged = merge_events([primary, duplicate])
+    assert len(merged) == 1
+    event = merged[0]
+    assert event.url == primary.url
+    assert event.alt_urls == ("https://unstop.com/foo",)
+    assert event.description == "About Foo"
+    assert event.logo_url == "https://img/foo.png"
+    assert event.start == START
+
+def test_same_title_further_apart_does_not_merge():
+    events = [make_event(), make_event(url="https://foo.example/finals", start=START + timedelta(days=2))]
+    assert len(merge_events(events)) == 2
+
+def test_disjoint_organizers_veto_a_title_match():
+    events = [
+        make_event(organizers=("Team A",)),
+        make_event(source=Source.UNSTOP, url="https://unstop.com/foo", organizers=("Team B",)),
+    ]
+    assert len(merge_events(events)) == 2
+
+def test_organizers_on_one_side_only_do_not_veto():
+    events = [
+        make_event(organizers=("Team A",)),
+        make_event(source=Source.UNSTOP, url="https://unstop.com/foo", organizers=("Unknown",)),
+    ]
+    assert len(merge_events(events)) == 1
+
+def test_missing_start_never_matches_by_title():
+    events = [make_event(start=None), make_event(url="https://other.example/", start=None)]
+    assert len(merge_events(events)) == 2
+
+def test_id_is_stable_and_owned_by_the_first_source():
+    primary = make_event()
+    duplicate = make_event(source=Source.UNSTOP, url="https://unstop.com/foo")
+    forward = merge_events([primary, duplicate])
+    again = merge_events([make_event(), make_event(source=Source.UNSTOP, url="https://unstop.com/foo")])
+    assert forward[0].id == again[0].id == event_id_from_url(primary.url)
+
+def test_inputs_are_not_modified():
+    primary = make_event(description='')
+    duplicate = make_event(source=Source.UNSTOP, url="https://unstop.com/foo", description="About Foo")
+    merge_events([primary, duplicate])
+    assert primary.description == ''
+    assert primary.sources == (Source.CTFTIME,)
+    assert primary.alt_urls == ()
+
+def test_all_ids_keep_an_event_recognizable_when_its_first_source_drops_out():
+    ctftime = make_event()
+    unstop = make_event(source=Source.UNSTOP, title="FooCTF", url="https://unstop.com/foo")
+    both = merge_events([ctftime, unstop])[0]
+    alone = merge_events([unstop])[0]
+    assert both.all_ids() == {event_id_from_url("https://foo.example/"): "https://foo.example/",
+                              event_id_from_url("https://unstop.com/foo"): "https://unstop.com/foo"}
+    assert alone.id != both.id
+    assert alone.id in both.all_ids()
@@ -0,0 +1,55 @@
+import pytest
+from scrapers import http_client
+from scrapers.http_client import CircuitBreaker
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(http_client.time, 'monotonic', fake)
+    return fake
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker(threshold=3, reset_after=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    assert breaker.retry_in() == 60
+
+def test_success_resets_the_failure_count(clock):
+    breaker = CircuitBreaker(threshold=2, reset_after=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.allow()
+
+def test_half_open_lets_a_single_trial_through(clock):
+    breaker = CircuitBreaker(threshold=1, reset_after=60)
+    breaker.record_failure()
+    clock.now += 61
+    assert breaker.allow()
+    # Everyone else keeps failing fast while the trial runs
+    assert not breaker.allow()
+
+def test_failed_trial_reopens_and_successful_trial_closes(clock):
+    breaker = CircuitBreaker(threshold=1, reset_after=60)
+    breaker.record_failure()
+    clock.now += 61
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    assert breaker.retry_in() == 60
+
+    clock.now += 61
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+    assert breaker.retry_in() == 0.0
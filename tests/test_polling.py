@@ -0,0 +1,62 @@
+import random
+from scrapers.polling import AdaptivePoller
+
+MIN, MAX = 60.0, 3600.0
+# Fixed wall clock so the hour-of-day heuristics see the same hours every run
+NOW = 1_800_000_000.0
+
+def make_poller():
+    poller = AdaptivePoller(initial_interval=300)
+    poller.register('src', MIN, MAX)
+    return poller
+
+def assert_in_bounds(poller, now):
+    assert MIN <= poller.interval('src') <= MAX
+    assert now + MIN <= poller.due_at('src') <= now + MAX
+
+def test_register_clamps_the_initial_interval():
+    poller = AdaptivePoller(initial_interval=10)
+    poller.register('src', MIN, MAX)
+    assert poller.interval('src') == MIN
+    assert poller.due_at('src') is None
+
+def test_errors_back_off_up_to_the_max_interval():
+    random.seed(1)
+    poller = make_poller()
+    now = NOW
+    for _ in range(12):
+        poller.record('src', 'error', now)
+        assert now + MIN <= poller.due_at('src') <= now + MAX
+        now += 60
+    assert poller.due_at('src') - (now - 60) == MAX
+
+def test_unchanged_polls_grow_the_interval_within_bounds():
+    random.seed(2)
+    poller = make_poller()
+    now = NOW
+    previous = poller.interval('src')
+    for _ in range(20):
+        poller.record('src', 'unchanged', now)
+        assert poller.interval('src') >= previous
+        assert_in_bounds(poller, now)
+        previous = poller.interval('src')
+        now += previous
+    assert poller.interval('src') == MAX
+
+def test_frequent_changes_tighten_down_to_the_min_interval():
+    random.seed(3)
+    poller = make_poller()
+    now = NOW
+    for _ in range(20):
+        poller.record('src', 'changed', now)
+        assert_in_bounds(poller, now)
+        now += 30
+    assert poller.interval('src') == MIN
+
+def test_next_due_is_the_earliest_source():
+    poller = make_poller()
+    poller.register('other', MIN, MAX)
+    assert poller.next_due() is None
+    poller.record('src', 'unchanged', NOW)
+    poller.poll_now('other')
+    assert poller.next_due() == poller.due_at('other') < poller.due_at('src')
@@ -0,0 +1,60 @@
+import asyncio
+import time
+from bot.scheduler import StartScheduler, parse_timestamp
+
+async def noop(keys):
+    pass
+
+def test_due_keys_come_out_in_deadline_order():
+    scheduler = StartScheduler(noop)
+    scheduler.schedule('b', 20.0)
+    scheduler.schedule('a', 10.0)
+    scheduler.schedule('c', 30.0)
+    assert scheduler.next_deadline() == 10.0
+    assert scheduler._pop_due(25.0) == ['a', 'b']
+    assert scheduler.next_deadline() == 30.0
+    assert len(scheduler) == 1
+
+def test_cancelled_key_never_fires():
+    scheduler = StartScheduler(noop)
+    scheduler.schedule('a', 10.0)
+    scheduler.schedule('b', 20.0)
+    scheduler.cancel('a')
+    assert scheduler.next_deadline() == 20.0
+    assert scheduler._pop_due(25.0) == ['b']
+    assert scheduler.next_deadline() is None
+
+def test_reschedule_keeps_only_the_new_deadline():
+    scheduler = StartScheduler(noop)
+    scheduler.schedule('a', 10.0)
+    scheduler.schedule('a', 40.0)
+    assert len(scheduler) == 1
+    assert scheduler._pop_due(25.0) == []
+    assert scheduler.next_deadline() == 40.0
+    assert scheduler._pop_due(45.0) == ['a']
+
+def test_runner_wakes_up_for_an_earlier_deadline():
+    fired = []
+
+    async def callback(keys):
+        fired.extend(keys)
+
+    async def main():
+        scheduler = StartScheduler(callback)
+        scheduler.schedule('later', time.time() + 3600)
+        scheduler.start()
+        await asyncio.sleep(0)
+        scheduler.schedule('now', time.time())
+        for _ in range(100):
+            if fired:
+                break
+            await asyncio.sleep(0.01)
+        scheduler.stop()
+
+    asyncio.run(main())
+    assert fired == ['now']
+
+def test_parse_timestamp():
+    assert parse_timestamp("2026-11-07T12:00:00+00:00") == parse_timestamp("2026-11-07T14:00:00+02:00")
+    assert parse_timestamp(None) is None
+    assert parse_timestamp("not a date") is None
@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+from scrapers.models import Event, Source
+from scrapers.snapshot import MAGIC, load_snapshot, save_snapshot
+
+START = datetime(2026, 11, 7, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+
+def make_events():
+    return [
+        Event(source=Source.CTFTIME, title="Foo CTF", url="https://foo.example/", start=START,
+              end=START + timedelta(days=2), type='CTF', organizers=("Foo Team",), weight=24.5,
+              sources=(Source.CTFTIME, Source.UNSTOP), alt_urls=("https://unstop.com/foo",)),
+        Event(source=Source.DEVPOST, title="Bar Hackathon", url="https://bar.devpost.com/", type='Hackathon', onsite=True),
+    ]
+
+def test_round_trip_keeps_every_field(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    events = make_events()
+    save_snapshot(path, {'CTFtime': (1234.5, events)})
+    loaded = load_snapshot(path)
+    assert list(loaded) == ['CTFtime']
+    fetched_at, restored = loaded['CTFtime']
+    assert fetched_at == 1234.5
+    assert [event.to_dict() for event in restored] == [event.to_dict() for event in events]
+    # The original UTC offset survives too
+    assert restored[0].start.utcoffset() == timedelta(hours=2)
+
+def test_too_old_snapshot_is_ignored(tmp_path):
+    path = str(tmp_path / "snapshot.bin")
+    save_snapshot(path, {'CTFtime': (1234.5, make_events())})
+    assert load_snapshot(path, max_age=-1) == {}
+
+def test_missing_or_damaged_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "snapshot.bin"
+    assert load_snapshot(str(path)) == {}
+    path.write_bytes(MAGIC + b'not zlib data')
+    assert load_snapshot(str(path)) == {}
+    path.write_bytes(b'EVSNAP0\n' + b'\x00' * 16)
+    assert load_snapshot(str(path)) == {}
@@ -0,0 +1,80 @@
+import json
+import types
+from bot.sharding import shard_scope
+from bot.storage import StateStore
+from scrapers.models import Event, Source, event_id_from_url
+
+def make_store(tmp_path):
+    return StateStore(str(tmp_path / "state.db"))
+
+def make_event(n: int):
+    return Event(source=Source.CTFTIME, title=f"Event {n}", url=f"https://example.org/{n}")
+
+def test_known_events_are_kept_per_shard_group(tmp_path):
+    store = make_store(tmp_path)
+    store.add_known_events('0', [('aa', "https://example.org/a", 100.0)])
+    store.add_known_events('1', [('bb', "https://example.org/b", 100.0)])
+    assert store.load_known_events('0', 50.0) == {'aa': 100.0}
+    assert store.load_known_events('1', 50.0) == {'bb': 100.0}
+
+def test_new_shard_group_starts_from_what_the_others_know(tmp_path):
+    store = make_store(tmp_path)
+    store.add_known_events('all', [('aa', "https://example.org/a", 100.0)])
+    assert store.load_known_events('0,1', 50.0) == {'aa': 100.0}
+    # Seeded once, later events stay with the group that announced them
+    store.add_known_events('all', [('bb', "https://example.org/b", 100.0)])
+    assert store.load_known_events('0,1', 50.0) == {'aa': 100.0}
+
+def test_prune_drops_expired_rows_of_every_scope(tmp_path):
+    store = make_store(tmp_path)
+    store.add_known_events('0', [('aa', None, 5.0), ('bb', None, 100.0)])
+    store.add_known_events('1', [('aa', None, 5.0)])
+    assert store.prune_known_events(10.0) == 2
+    assert store.load_known_events('0', 50.0) == {'bb': 100.0}
+
+def test_shard_scope():
+    assert shard_scope(types.SimpleNamespace(shard_count=None)) == 'all'
+    assert shard_scope(types.SimpleNamespace(shard_count=4, shard_ids=None)) == 'all'
+    assert shard_scope(types.SimpleNamespace(shard_count=4, shard_ids=[3, 1])) == '1,3'
+
+def test_prune_events_keeps_payloads_still_referenced(tmp_path):
+    store = make_store(tmp_path)
+    events = [make_event(n) for n in range(4)]
+    store.save_events(events)
+    store.add_known_events('all', [(events[0].id, events[0].url, 100.0)])
+    store.upsert_active_event('1', events[1].id, {'channel_id': 5, 'url': events[1].url, 'title': events[1].title,
+                                                 'start_date': None, 'notified_start': False})
+    store.publish_catalog([events[2]], [])
+    assert store.prune_events() == 1
+    assert set(store.get_events(event.id for event in events)) == {events[0].id, events[1].id, events[2].id}
+
+def test_migrate_from_json_imports_the_legacy_files_once(tmp_path):
+    subscriptions = tmp_path / "subscriptions.json"
+    known = tmp_path / "known_events.json"
+    active = tmp_path / "active_events.json"
+    subscriptions.write_text(json.dumps({"111": 222}))
+    known.write_text(json.dumps(["https://example.org/1", "https://example.org/2"]))
+    active.write_text(json.dumps({"111": {"https://example.org/1": {
+        "channel_id": 333, "title": "Event 1", "start_date": "2026-11-07T12:00:00+00:00", "notified_start": True}}}))
+    files = (str(subscriptions), str(known), str(active))
+
+    store = make_store(tmp_path)
+    store.migrate_from_json(*files, event_id_from_url)
+
+    assert store.load_subscriptions() == {"111": 222}
+    # Legacy rows have no expiry yet and get the default
+    assert store.load_known_events('all', 50.0) == {
+        event_id_from_url("https://example.org/1"): 50.0,
+        event_id_from_url("https://example.org/2"): 50.0,
+    }
+    assert store.load_active_events() == {"111": {event_id_from_url("https://example.org/1"): {
+        "channel_id": 333, "url": "https://example.org/1", "title": "Event 1",
+        "start_date": "2026-11-07T12:00:00+00:00", "notified_start": True}}}
+    for path in (subscriptions, known, active):
+        assert not path.exists()
+        assert (tmp_path / (path.name + ".migrated")).exists()
+
+    # Files showing up again are not imported twice
+    subscriptions.write_text(json.dumps({"444": 555}))
+    store.migrate_from_json(*files, event_id_from_url)
+    assert store.load_subscriptions() == {"111": 222}